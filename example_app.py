@@ -15,6 +15,11 @@ from larapy.http.request import Request
 from larapy.database.orm import DatabaseConnection
 
 
+# Input fields accepted by UserController
+_STORE_FIELDS = frozenset(('name', 'email', 'password'))
+_UPDATE_FIELDS = frozenset(('name', 'email'))
+
+
 # Example Model
 class User(Model):
     table = 'users'
@@ -35,8 +40,7 @@ class UserController:
     
     def index(self):
         """Get all users"""
-        users = User.all()
-        return Response.json([user.to_dict() for user in users])
+        return Response.stream_json(User.query().select('id', 'name', 'email').cursor())
     
     def show(self, id: int):
         """Get a specific user"""
@@ -47,7 +51,7 @@ class UserController:
     
     def store(self, request: Request):
         """Create a new user"""
-        data = request.only(['name', 'email', 'password'])
+        data = request.only(_STORE_FIELDS)
         
         # Simple validation
         if not all([data.get('name'), data.get('email'), data.get('password')]):
@@ -67,7 +71,7 @@ class UserController:
         if not user:
             return Response.json({'error': 'User not found'}, 404)
         
-        data = request.only(['name', 'email'])
+        data = request.only(_UPDATE_FIELDS)
         for key, value in data.items():
             if value:  # Only update non-empty values
                 setattr(user, key, value)
@@ -120,10 +124,8 @@ class AppServiceProvider:
         # Bind to container
         self.app.singleton('db', lambda app: db_manager)
         
-        # Set connection for models
+        # Models resolve this connection from the container on first use
         connection = db_manager.connection('default')
-        User.set_connection(connection)
-        Post.set_connection(connection)
         
         # Create tables if they don't exist
         self._create_tables(connection)
@@ -142,6 +144,8 @@ class AppServiceProvider:
                 table.timestamps()
             
             schema.create_table('users', create_users_table)
+            connection.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_users_email ON users(email)")
+            connection.commit()
         
         # Create posts table
         if not schema.has_table('posts'):
@@ -175,6 +179,25 @@ class AppServiceProvider:
         router.get('/health', lambda: Response.json({'status': 'ok'}))
 
 
+# Sample data seeder
+def seed():
+    """Create sample users and posts if the users table is empty"""
+    if User.query().exists():
+        return
+    
+    # Create sample users
+    User.bulk_create([
+        {'name': 'John Doe', 'email': 'john@example.com', 'password': 'password123'},
+        {'name': 'Jane Smith', 'email': 'jane@example.com', 'password': 'password456'},
+    ])
+    
+    # Create sample posts
+    Post.bulk_create([
+        {'title': 'First Post', 'content': 'This is the first post content', 'user_id': 1},
+        {'title': 'Second Post', 'content': 'This is the second post content', 'user_id': 2},
+    ])
+
+
 # Create and configure the application
 def create_app():
     """Application factory"""
@@ -186,18 +209,14 @@ def create_app():
     # Register custom service provider
     app.register(AppServiceProvider(app))
     
-    # Add some sample data
-    @app.flask_app.before_first_request
-    def create_sample_data():
-        # Check if we already have users
-        if User.count() == 0:
-            # Create sample users
-            User.create(name='John Doe', email='john@example.com', password='password123')
-            User.create(name='Jane Smith', email='jane@example.com', password='password456')
-            
-            # Create sample posts
-            Post.create(title='First Post', content='This is the first post content', user_id=1)
-            Post.create(title='Second Post', content='This is the second post content', user_id=2)
+    # Seed sample data at startup so no request pays for the check,
+    # and expose the same seeder as `flask seed` for manual re-runs
+    with app.flask_app.app_context():
+        seed()
+    
+    @app.flask_app.cli.command('seed')
+    def seed_command():
+        seed()
     
     return app
 
@@ -4,16 +4,20 @@ AuthManager - Core authentication manager for Larapy
 Handles user authentication, session management, and user retrieval.
 """
 
-from werkzeug.security import generate_password_hash, check_password_hash
-from flask import session, current_app
+from werkzeug.security import generate_password_hash
+from flask import session, current_app, g, has_request_context
 from typing import Optional, Dict, Any
 
+from .authenticatable import _verify
+
 
 class AuthManager:
     """
     Core authentication manager that handles login, logout, and user management.
     """
     
+    __slots__ = ('app', '_user_model')
+    
     def __init__(self, app=None):
         """
         Initialize the AuthManager.
@@ -23,7 +27,6 @@ class AuthManager:
         """
         self.app = app
         self._user_model = None
-        self._user_provider = None
         
     def set_user_model(self, model_class):
         """
@@ -55,7 +58,7 @@ class AuthManager:
             return False
             
         # Find user by email
-        user = self._user_model.where('email', email).first()
+        user = self._find_by_email(email)
         
         if not user:
             return False
@@ -64,7 +67,7 @@ class AuthManager:
         if hasattr(user, 'verify_password'):
             password_valid = user.verify_password(password)
         else:
-            password_valid = check_password_hash(user.password, password)
+            password_valid = _verify(user.password, password)
             
         if password_valid:
             self.login(user)
@@ -72,6 +75,21 @@ class AuthManager:
             
         return False
     
+    def _find_by_email(self, email: str):
+        """
+        Find a user by email using the model's credential lookup if it has one.
+        
+        Args:
+            email: The email address to search for
+            
+        Returns:
+            User or None: The matching user
+        """
+        finder = getattr(self._user_model, 'find_for_credentials', None)
+        if finder is not None:
+            return finder(email)
+        return self._user_model.where('email', email).first()
+    
     def login(self, user, remember: bool = False):
         """
         Log in a user by storing their ID in the session.
@@ -85,6 +103,7 @@ class AuthManager:
         """
         session['user_id'] = user.id
         session['user_authenticated'] = True
+        g._larapy_user = user
         
         if remember:
             session.permanent = True
@@ -114,6 +133,8 @@ class AuthManager:
         """
         Log out the current user by clearing the session.
         """
+        if has_request_context():
+            g._larapy_user = None
         session.pop('user_id', None)
         session.pop('user_authenticated', None)
         session.permanent = False
@@ -122,6 +143,8 @@ class AuthManager:
         """
         Get the currently authenticated user.
         
+        The user is loaded once per request and cached on ``flask.g``.
+        
         Returns:
             User or None: The authenticated user or None if not logged in
         """
@@ -131,8 +154,14 @@ class AuthManager:
         user_id = session.get('user_id')
         if not user_id or not self._user_model:
             return None
+        
+        cached = g.get('_larapy_user')
+        if cached is not None and cached.id == user_id:
+            return cached
             
-        return self._user_model.find(user_id)
+        user = self._user_model.find(user_id)
+        g._larapy_user = user
+        return user
     
     def id(self) -> Optional[int]:
         """
@@ -150,7 +179,7 @@ class AuthManager:
         Returns:
             bool: True if authenticated, False otherwise
         """
-        return session.get('user_authenticated', False) and 'user_id' in session
+        return 'user_id' in session and session.get('user_authenticated', False)
     
     def guest(self) -> bool:
         """
@@ -159,7 +188,7 @@ class AuthManager:
         Returns:
             bool: True if guest, False if authenticated
         """
-        return not self.check()
+        return 'user_id' not in session
     
     def once(self, credentials: Dict[str, str]) -> bool:
         """
@@ -180,7 +209,7 @@ class AuthManager:
         if not email or not password:
             return False
             
-        user = self._user_model.where('email', email).first()
+        user = self._find_by_email(email)
         
         if not user:
             return False
@@ -188,7 +217,7 @@ class AuthManager:
         if hasattr(user, 'verify_password'):
             return user.verify_password(password)
         else:
-            return check_password_hash(user.password, password)
+            return _verify(user.password, password)
     
     def validate(self, credentials: Dict[str, str]) -> bool:
         """
@@ -6,9 +6,54 @@ methods that can be used with User models in Larapy.
 """
 
 from werkzeug.security import generate_password_hash, check_password_hash
-from typing import Optional
+from typing import Optional, Tuple
+from collections import OrderedDict
+from hashlib import sha256
 import secrets
-import string
+import threading
+
+
+# Credential lookup SQL, built once per table
+_CREDENTIALS_SQL = "SELECT * FROM {table} WHERE email = ? LIMIT 1"
+_credentials_queries = {}
+
+
+# (password hash, digest of the plain text password) -> verification result
+_VERIFY_CACHE: "OrderedDict[Tuple[str, bytes], bool]" = OrderedDict()
+_VERIFY_CACHE_MAXSIZE = 1024
+_VERIFY_LOCK = threading.Lock()
+
+
+def _verify(hash_str: str, password: str) -> bool:
+    """
+    Check a plain text password against a stored hash, memoizing the result.
+    
+    PBKDF2 verification is deliberately slow, so repeated identical checks
+    (e.g. ``AuthManager.once`` on every API request) are answered from an
+    in-process LRU cache. The cache is keyed on a SHA-256 digest of the
+    password, so plain text passwords are never kept. A changed password
+    has a new hash, so stale entries are never hit and just age out.
+    
+    Args:
+        hash_str: The stored password hash
+        password: Plain text password to verify
+        
+    Returns:
+        bool: True if password matches, False otherwise
+    """
+    key = (hash_str, sha256(password.encode()).digest())
+    with _VERIFY_LOCK:
+        result = _VERIFY_CACHE.get(key)
+        if result is not None:
+            _VERIFY_CACHE.move_to_end(key)
+            return result
+    
+    result = check_password_hash(hash_str, password)
+    with _VERIFY_LOCK:
+        _VERIFY_CACHE[key] = result
+        if len(_VERIFY_CACHE) > _VERIFY_CACHE_MAXSIZE:
+            _VERIFY_CACHE.popitem(last=False)
+    return result
 
 
 class Authenticatable:
@@ -40,7 +85,7 @@ class Authenticatable:
         """
         if not hasattr(self, 'password') or not self.password:
             return False
-        return check_password_hash(self.password, password)
+        return _verify(self.password, password)
     
     def set_remember_token(self, token: Optional[str] = None):
         """
@@ -81,8 +126,7 @@ class Authenticatable:
         Returns:
             str: Randomly generated token
         """
-        alphabet = string.ascii_letters + string.digits
-        return ''.join(secrets.choice(alphabet) for _ in range(length))
+        return secrets.token_urlsafe(length * 3 // 4 + 1)[:length]
     
     def get_auth_identifier(self):
         """
@@ -133,6 +177,33 @@ class Authenticatable:
         """
         return cls.find(identifier)
     
+    @classmethod
+    def find_for_credentials(cls, email: str):
+        """
+        Find a user by email for a login attempt.
+        
+        Runs a prepared ``SELECT ... LIMIT 1`` directly on the model's
+        connection, skipping the query builder. Falls back to ``where()``
+        for models that do not manage a connection.
+        
+        Args:
+            email: The email address to search for
+            
+        Returns:
+            User instance or None
+        """
+        resolve_connection = getattr(cls, '_connection', None)
+        if resolve_connection is None:
+            return cls.where('email', email).first()
+        connection = resolve_connection()
+        
+        query = _credentials_queries.get(cls.table)
+        if query is None:
+            query = _credentials_queries[cls.table] = _CREDENTIALS_SQL.format(table=cls.table)
+        
+        row = connection.fetch_one(query, (email,))
+        return cls._hydrate(row) if row else None
+    
     @classmethod
     def find_by_remember_token(cls, token: str):
         """
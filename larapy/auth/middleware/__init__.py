@@ -1 +1,21 @@
-# Auth middleware package
\ No newline at end of file
+# Auth middleware package
+
+from .decorators import (
+    AuthMiddleware,
+    auth_api,
+    auth_required,
+    guest_api,
+    guest_only,
+    throttle,
+    verify_csrf_token,
+)
+
+__all__ = [
+    'AuthMiddleware',
+    'auth_api',
+    'auth_required',
+    'guest_api',
+    'guest_only',
+    'throttle',
+    'verify_csrf_token',
+]
@@ -5,63 +5,176 @@ Provides Laravel-style authentication middleware with guard support.
 Handles user authentication, guest middleware, and remember me functionality.
 """
 
-from typing import Optional, Dict, Any
+import os
+import re
+import threading
+from time import monotonic as _now, time as _wall_time
+from hashlib import sha256
+from typing import Optional, Dict, Any, Tuple
 from flask import request, session, g, abort, redirect, url_for, current_app
 from functools import wraps
 
+try:
+    from pyinstrument import Profiler
+except ImportError:
+    Profiler = None
+
+# Opt-in profiling of authenticated views: LARAPY_PROFILE=1 and ?profile=1
+_PROFILE = os.getenv('LARAPY_PROFILE') == '1' and Profiler is not None
+
+# The application's User model, imported on first use; see _user_model()
+_USER_MODEL = None
+
+# sha256(api token) -> (user id, expires at); see Authenticate.token_cache_ttl
+_TOKEN_CACHE: Dict[bytes, Tuple[Any, float]] = {}
+_TOKEN_CACHE_MAXSIZE = 10_000
+# Guards writes and scans; requests on a threaded server share the cache
+_TOKEN_CACHE_LOCK = threading.Lock()
+
+# Request methods whose body may carry an api_token form field
+_FORM_METHODS = frozenset(('POST', 'PUT', 'PATCH'))
+
+# Paths register_auth() leaves alone (static assets, health checks)
+_SKIP_AUTH_PATHS = re.compile(r'^/(?:static/|health(?:z)?$|favicon\.ico$)')
+
+
+def _guard_method(guard: str, guards: Dict[str, str]) -> str:
+    """
+    Look up the check method for a guard
+    
+    Args:
+        guard: Guard name
+        guards: Guard name -> method name table
+        
+    Returns:
+        str: Method name
+        
+    Raises:
+        ValueError: If the guard is not supported
+    """
+    try:
+        return guards[guard]
+    except KeyError:
+        raise ValueError(f"Unsupported auth guard [{guard}]") from None
+
+
+def _profiled(f):
+    """
+    Wrap a view so requests with ?profile=1 are profiled with pyinstrument
+    
+    The report is written to the application log.
+    
+    Args:
+        f: View function
+        
+    Returns:
+        Wrapped view function
+    """
+    @wraps(f)
+    def profiled_function(*args, **kwargs):
+        if not request.args.get('profile'):
+            return f(*args, **kwargs)
+        
+        profiler = Profiler(async_mode='disabled')
+        profiler.start()
+        try:
+            return f(*args, **kwargs)
+        finally:
+            profiler.stop()
+            current_app.logger.info(profiler.output_text(unicode=True, color=False))
+    
+    return profiled_function
+
+
+def _user_model():
+    """
+    Get the application's User model, importing it on first use
+    
+    Only a successful import is cached, so a model that is not importable
+    yet (larapy imported before the app package, a circular import) is
+    picked up on a later call.
+    
+    Returns:
+        User model class or None if app.Models.User cannot be imported
+    """
+    global _USER_MODEL
+    if _USER_MODEL is None:
+        try:
+            from app.Models.User import User
+        except ImportError:
+            return None
+        _USER_MODEL = User
+    return _USER_MODEL
+
+
+def _endpoint_url(endpoint: str, fallback: str) -> str:
+    """
+    Get the URL for an endpoint, building it once per application
+    
+    Args:
+        endpoint: Endpoint name, e.g. 'login'
+        fallback: URL used when the endpoint is not registered
+        
+    Returns:
+        str: URL for the endpoint
+    """
+    app = current_app._get_current_object()
+    try:
+        return app.extensions['larapy_auth_urls'][endpoint]
+    except KeyError:
+        pass
+    
+    urls = app.extensions.setdefault('larapy_auth_urls', {})
+    url = urls[endpoint] = url_for(endpoint) if endpoint in app.view_functions else fallback
+    return url
+
 
 class Authenticate:
     """
     Middleware for requiring authentication
     """
     
+    __slots__ = ('guards', '_guard_fns', '_api_guard')
+    
+    # Guard name -> check method
+    _GUARDS = {'web': '_check_web_auth', 'api': '_check_api_auth'}
+    
+    # Seconds a resolved API token stays cached; a revoked token keeps
+    # working for at most this long. Set to 0 to disable the cache.
+    token_cache_ttl = 60
+    
     def __init__(self, guards: Optional[list] = None):
         """
         Initialize authentication middleware
         
         Args:
             guards: List of guards to check (defaults to ['web'])
+            
+        Raises:
+            ValueError: If a guard is not supported
         """
         self.guards = guards or ['web']
+        self._guard_fns = tuple(getattr(self, _guard_method(guard, self._GUARDS)) for guard in self.guards)
+        self._api_guard = 'api' in self.guards
     
     def __call__(self, f):
         """
         Decorator for route functions
         """
+        guard_fns = self._guard_fns
+        
         @wraps(f)
         def decorated_function(*args, **kwargs):
             # Check authentication for each guard
-            authenticated = False
-            
-            for guard in self.guards:
-                if self._check_guard(guard):
-                    authenticated = True
-                    break
-            
-            if not authenticated:
+            if not any(fn() for fn in guard_fns):
                 return self._handle_unauthenticated()
             
             return f(*args, **kwargs)
         
+        if _PROFILE:
+            return _profiled(decorated_function)
         return decorated_function
     
-    def _check_guard(self, guard: str) -> bool:
-        """
-        Check if user is authenticated with specific guard
-        
-        Args:
-            guard: Guard name to check
-            
-        Returns:
-            bool: True if authenticated
-        """
-        if guard == 'web':
-            return self._check_web_auth()
-        elif guard == 'api':
-            return self._check_api_auth()
-        
-        return False
-    
     def _check_web_auth(self) -> bool:
         """
         Check web session authentication
@@ -69,17 +182,16 @@ class Authenticate:
         Returns:
             bool: True if authenticated via web session
         """
+        # register_auth() already resolved the session user for this request
+        if g.get('_auth_resolved'):
+            return g.get('user') is not None
+        
         user_id = session.get('user_id')
         if not user_id:
             return False
         
         # Load user and set in Flask's g object
-        user = self._load_user(user_id)
-        if user:
-            g.user = user
-            return True
-        
-        return False
+        return self._resolve_user(('web', user_id), self._load_user, user_id)
     
     def _check_api_auth(self) -> bool:
         """
@@ -90,20 +202,47 @@ class Authenticate:
         """
         # Check Authorization header
         auth_header = request.headers.get('Authorization', '')
-        if auth_header.startswith('Bearer '):
+        if auth_header[:7] == 'Bearer ':
             token = auth_header[7:]  # Remove 'Bearer ' prefix
-            user = self._load_user_by_token(token)
-            if user:
-                g.user = user
+            if self._resolve_user(('api', token), self._load_user_by_token, token):
                 return True
         
-        # Check api_token parameter
-        token = request.args.get('api_token') or request.form.get('api_token')
+        # Check api_token parameter; only parse a form body for methods that send one
+        token = request.args.get('api_token')
+        if not token and request.method in _FORM_METHODS:
+            token = request.form.get('api_token')
         if token:
-            user = self._load_user_by_token(token)
-            if user:
-                g.user = user
-                return True
+            return self._resolve_user(('api', token), self._load_user_by_token, token)
+        
+        return False
+    
+    def _resolve_user(self, key: tuple, loader, credential) -> bool:
+        """
+        Load a user once per request and set it in Flask's g object
+        
+        Results are cached on g._auth_users keyed by (guard, credential),
+        so stacked middleware on the same request reuses the lookup.
+        
+        Args:
+            key: (guard, credential) cache key
+            loader: Callable that loads the user from the credential
+            credential: User ID or API token
+            
+        Returns:
+            bool: True if a user was found
+        """
+        users = g.get('_auth_users')
+        if users is None:
+            users = g._auth_users = {}
+        
+        if key in users:
+            user = users[key]
+        else:
+            user = users[key] = loader(credential)
+        
+        if user:
+            g.user = user
+            return True
         
         return False
     
@@ -115,18 +254,12 @@ class Authenticate:
             user_id: User ID
             
         Returns:
-            User object or None
+            User object or None if the user or the User model is missing
         """
-        # This would typically load from database
-        # For now, return a simple dict representation
-        # In real implementation, integrate with your User model
-        try:
-            # Import and use the User model
-            from app.Models.User import User
-            return User.find(user_id)
-        except ImportError:
-            # Fallback if User model not available
-            return {'id': user_id, 'name': 'User'}
+        model = _user_model()
+        if model is None:
+            return None
+        return model.find(user_id)
     
     def _load_user_by_token(self, token: str):
         """
@@ -138,12 +271,30 @@ class Authenticate:
         Returns:
             User object or None
         """
-        try:
-            # Import and use the User model
-            from app.Models.User import User
-            return User.where('api_token', token).first()
-        except ImportError:
+        model = _user_model()
+        if model is None:
             return None
+        
+        ttl = self.token_cache_ttl
+        if ttl <= 0:
+            return model.where('api_token', token).first()
+        
+        key = sha256(token.encode()).digest()
+        now = _now()
+        cached = _TOKEN_CACHE.get(key)
+        if cached is not None and cached[1] > now:
+            return self._load_user(cached[0])
+        
+        user = model.where('api_token', token).first()
+        with _TOKEN_CACHE_LOCK:
+            if user:
+                if len(_TOKEN_CACHE) >= _TOKEN_CACHE_MAXSIZE:
+                    # Drop the oldest entry to keep the cache bounded
+                    del _TOKEN_CACHE[next(iter(_TOKEN_CACHE))]
+                _TOKEN_CACHE[key] = (user.id, now + ttl)
+            else:
+                _TOKEN_CACHE.pop(key, None)
+        return user
     
     def _handle_unauthenticated(self):
         """
@@ -157,8 +308,7 @@ class Authenticate:
             abort(401, description={'message': 'Unauthenticated'})
         
         # For web requests, redirect to login
-        login_url = url_for('login') if hasattr(current_app, 'url_map') else '/login'
-        return redirect(login_url)
+        return redirect(_endpoint_url('login', '/login'))
     
     def _is_api_request(self) -> bool:
         """
@@ -167,9 +317,15 @@ class Authenticate:
         Returns:
             bool: True if API request
         """
-        return (request.path.startswith('/api/') or 
-                request.headers.get('Accept', '').startswith('application/json') or
-                'api' in self.guards)
+        if self._api_guard:
+            return True
+        
+        # The request part of the answer cannot change, so compute it once
+        is_api = g.get('_is_api')
+        if is_api is None:
+            is_api = g._is_api = (request.path[:5] == '/api/' or
+                                  request.accept_mimetypes.best == 'application/json')
+        return is_api
 
 
 class RedirectIfAuthenticated:
@@ -177,6 +333,11 @@ class RedirectIfAuthenticated:
     Middleware for redirecting authenticated users (guest middleware)
     """
     
+    __slots__ = ('guards', 'redirect_to', '_guard_fns')
+    
+    # Guard name -> check method
+    _GUARDS = {'web': '_check_web_auth', 'api': '_check_api_auth'}
+    
     def __init__(self, guards: Optional[list] = None, redirect_to: str = '/dashboard'):
         """
         Initialize guest middleware
@@ -187,39 +348,43 @@ class RedirectIfAuthenticated:
         """
         self.guards = guards or ['web']
         self.redirect_to = redirect_to
+        self._guard_fns = tuple(getattr(self, _guard_method(guard, self._GUARDS)) for guard in self.guards)
     
     def __call__(self, f):
         """
         Decorator for route functions
         """
+        guard_fns = self._guard_fns
+        
         @wraps(f)
         def decorated_function(*args, **kwargs):
             # Check if user is authenticated
-            for guard in self.guards:
-                if self._check_guard(guard):
-                    return redirect(self.redirect_to)
+            if any(fn() for fn in guard_fns):
+                return redirect(self.redirect_to)
             
             return f(*args, **kwargs)
         
         return decorated_function
     
-    def _check_guard(self, guard: str) -> bool:
+    @staticmethod
+    def _check_web_auth() -> bool:
         """
-        Check if user is authenticated with specific guard
+        Check for a web session
         
-        Args:
-            guard: Guard name to check
-            
         Returns:
-            bool: True if authenticated
+            bool: True if a user is logged in
+        """
+        return 'user_id' in session
+    
+    @staticmethod
+    def _check_api_auth() -> bool:
         """
-        if guard == 'web':
-            return 'user_id' in session
-        elif guard == 'api':
-            auth_header = request.headers.get('Authorization', '')
-            return auth_header.startswith('Bearer ')
+        Check for an API bearer token
         
-        return False
+        Returns:
+            bool: True if a bearer token was sent
+        """
+        return request.headers.get('Authorization', '')[:7] == 'Bearer '
 
 
 class VerifyPassword:
@@ -227,6 +392,8 @@ class VerifyPassword:
     Middleware for verifying password before sensitive operations
     """
     
+    __slots__ = ('timeout',)
+    
     def __init__(self, timeout: int = 10800):  # 3 hours default
         """
         Initialize password verification middleware
@@ -256,9 +423,8 @@ class VerifyPassword:
         Returns:
             bool: True if password confirmed within timeout
         """
-        import time
         last_confirmed = session.get('password_confirmed_at', 0)
-        return (time.time() - last_confirmed) < self.timeout
+        return (_wall_time() - last_confirmed) < self.timeout
     
     def _redirect_to_password_confirm(self):
         """
@@ -267,8 +433,7 @@ class VerifyPassword:
         Returns:
             Redirect response
         """
-        confirm_url = url_for('password.confirm') if hasattr(current_app, 'url_map') else '/password/confirm'
-        return redirect(confirm_url)
+        return redirect(_endpoint_url('password.confirm', '/password/confirm'))
 
 
 # Authentication helper functions
@@ -322,7 +487,7 @@ def auth_login(user, remember: bool = False):
         remember: Enable remember me functionality
     """
     session['user_id'] = user.id
-    session.permanent = remember
+    session.permanent = bool(remember)
     g.user = user
     
     # Regenerate session ID for security
@@ -333,6 +498,14 @@ def auth_logout():
     """
     Log out the current user
     """
+    user = getattr(g, 'user', None)
+    user_id = getattr(user, 'id', None)
+    if user_id is not None:
+        # Forget every cached API token resolving to this user
+        with _TOKEN_CACHE_LOCK:
+            for key in [key for key, (uid, _) in _TOKEN_CACHE.items() if uid == user_id]:
+                del _TOKEN_CACHE[key]
+    
     session.pop('user_id', None)
     session.pop('password_confirmed_at', None)
     if hasattr(g, 'user'):
@@ -343,8 +516,38 @@ def confirm_password():
     """
     Mark password as recently confirmed
     """
-    import time
-    session['password_confirmed_at'] = time.time()
+    # Wall clock: the value outlives this process in the session cookie
+    session['password_confirmed_at'] = _wall_time()
+
+
+def register_auth(app, skip_paths: Optional[re.Pattern] = None):
+    """
+    Resolve the session user once per request before any view runs
+    
+    Populates g.user from the session in a single before_request hook so
+    web guards only need to look at g, however many are stacked on a view.
+    
+    Args:
+        app: Flask application
+        skip_paths: Pattern of paths that skip user resolution
+                    (defaults to static assets and health checks)
+    """
+    skip = (skip_paths or _SKIP_AUTH_PATHS).match
+    load_user = auth_middleware._load_user
+    # Redirect URLs are filled in on first use, once routes are registered
+    app.extensions.setdefault('larapy_auth_urls', {})
+    
+    @app.before_request
+    def _resolve_auth_user():
+        if skip(request.path):
+            return
+        
+        g._auth_resolved = True
+        user_id = session.get('user_id')
+        if user_id:
+            user = load_user(user_id)
+            if user:
+                g.user = user
 
 
 # Convenience decorators
@@ -10,6 +10,33 @@ from flask import request, jsonify, redirect, url_for, session, current_app
 from typing import Callable, Any, Optional
 
 
+# Methods that require a CSRF token
+_UNSAFE = frozenset(('POST', 'PUT', 'PATCH', 'DELETE'))
+
+
+def _auth():
+    """
+    Get the AuthManager AuthMiddleware.init_app registered on the current app.
+    
+    Returns:
+        AuthManager instance or None
+    """
+    return current_app.extensions.get('larapy_auth')
+
+
+def _check() -> bool:
+    """
+    Check whether the current request is authenticated.
+    
+    Uses the AuthManager registered by AuthMiddleware.init_app, falling back
+    to the session flag when no manager has been registered.
+    """
+    auth = _auth()
+    if auth is None:
+        return session.get('user_authenticated', False)
+    return auth.check()
+
+
 def auth_required(redirect_to: str = '/login', api: bool = False):
     """
     Middleware decorator that requires authentication to access a route.
@@ -24,29 +51,10 @@ def auth_required(redirect_to: str = '/login', api: bool = False):
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Get auth manager from application container
-            try:
-                if hasattr(current_app, 'container'):
-                    auth = current_app.container.resolve('auth')
-                else:
-                    # Fallback: check session directly
-                    if not session.get('user_authenticated', False):
-                        if api:
-                            return jsonify({'error': 'Unauthenticated'}), 401
-                        return redirect(redirect_to)
-                    return f(*args, **kwargs)
-                
-                if not auth.check():
-                    if api:
-                        return jsonify({'error': 'Unauthenticated'}), 401
-                    return redirect(redirect_to)
-                    
-            except Exception:
-                # Fallback to session check if container/auth not available
-                if not session.get('user_authenticated', False):
-                    if api:
-                        return jsonify({'error': 'Unauthenticated'}), 401
-                    return redirect(redirect_to)
+            if not _check():
+                if api:
+                    return jsonify({'error': 'Unauthenticated'}), 401
+                return redirect(redirect_to)
             
             return f(*args, **kwargs)
         return decorated_function
@@ -67,29 +75,10 @@ def guest_only(redirect_to: str = '/home', api: bool = False):
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Get auth manager from application container
-            try:
-                if hasattr(current_app, 'container'):
-                    auth = current_app.container.resolve('auth')
-                else:
-                    # Fallback: check session directly
-                    if session.get('user_authenticated', False):
-                        if api:
-                            return jsonify({'error': 'Already authenticated'}), 403
-                        return redirect(redirect_to)
-                    return f(*args, **kwargs)
-                
-                if auth.check():
-                    if api:
-                        return jsonify({'error': 'Already authenticated'}), 403
-                    return redirect(redirect_to)
-                    
-            except Exception:
-                # Fallback to session check if container/auth not available
-                if session.get('user_authenticated', False):
-                    if api:
-                        return jsonify({'error': 'Already authenticated'}), 403
-                    return redirect(redirect_to)
+            if _check():
+                if api:
+                    return jsonify({'error': 'Already authenticated'}), 403
+                return redirect(redirect_to)
             
             return f(*args, **kwargs)
         return decorated_function
@@ -119,25 +108,46 @@ class AuthMiddleware:
     Can be used with Flask's before_request decorator or similar middleware systems.
     """
     
-    def __init__(self, app=None):
+    __slots__ = ('app',)
+    
+    def __init__(self, app=None, auth=None):
         """
         Initialize the middleware.
         
         Args:
             app: Flask application instance
+            auth: AuthManager instance, resolved from the container if omitted
         """
         self.app = app
         if app is not None:
-            self.init_app(app)
+            self.init_app(app, auth)
     
-    def init_app(self, app):
+    def init_app(self, app, auth=None):
         """
         Initialize the middleware with the application.
         
+        Resolves the AuthManager once and stores it in app.extensions for the
+        route decorators so they do not touch the container on every request.
+        
         Args:
             app: Flask application instance
+            auth: AuthManager instance, resolved from the container if omitted
+            
+        Raises:
+            RuntimeError: If no AuthManager is given or bound as 'auth'
         """
         self.app = app
+        if auth is None:
+            container = getattr(app, 'container', None)
+            if container is not None:
+                auth = container.resolve('auth')
+            if auth is None or isinstance(auth, str):
+                raise RuntimeError(
+                    "AuthMiddleware requires an AuthManager. Pass auth= or "
+                    "register an 'auth' binding in the application container."
+                )
+        
+        app.extensions['larapy_auth'] = auth
         app.before_request(self.before_request)
     
     def before_request(self):
@@ -156,14 +166,7 @@ class AuthMiddleware:
         Returns:
             bool: True if authenticated, False otherwise
         """
-        try:
-            if hasattr(current_app, 'container'):
-                auth = current_app.container.resolve('auth')
-                return auth.check()
-            else:
-                return session.get('user_authenticated', False)
-        except Exception:
-            return session.get('user_authenticated', False)
+        return _check()
     
     @staticmethod
     def user():
@@ -173,19 +176,16 @@ class AuthMiddleware:
         Returns:
             User instance or None
         """
-        try:
-            if hasattr(current_app, 'container'):
-                auth = current_app.container.resolve('auth')
-                return auth.user()
-            else:
-                return None
-        except Exception:
+        auth = _auth()
+        if auth is None:
             return None
+        return auth.user()
 
 
 def verify_csrf_token():
     """
-    Middleware decorator to verify CSRF tokens for POST requests.
+    Middleware decorator to verify CSRF tokens for POST, PUT, PATCH and
+    DELETE requests.
     
     Note: This is a basic implementation. For production use,
     consider using Flask-WTF or similar CSRF protection.
@@ -193,7 +193,7 @@ def verify_csrf_token():
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if request.method == 'POST':
+            if request.method in _UNSAFE:
                 token = request.form.get('_token') or request.headers.get('X-CSRF-TOKEN')
                 session_token = session.get('_token')
                 
@@ -221,13 +221,9 @@ def throttle(max_attempts: int = 60, window_minutes: int = 1):
     def decorator(f: Callable) -> Callable:
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            # Basic implementation - in production, use Redis or similar
-            client_ip = request.environ.get('REMOTE_ADDR', '127.0.0.1')
-            rate_key = f"throttle:{client_ip}:{request.endpoint}"
-            
-            # This is a very basic implementation
-            # In production, implement proper rate limiting with Redis
-            
+            # No rate limit backend is wired in yet, so there is no key to build.
+            # In production, implement proper rate limiting with Redis keyed on
+            # "throttle:{client_ip}:{endpoint}".
             return f(*args, **kwargs)
         return decorated_function
-    return decorator
\ No newline at end of file
+    return decorator
@@ -5,24 +5,57 @@ Implements token bucket algorithm for rate limiting requests.
 Supports per-user, per-IP, and custom key rate limiting.
 """
 
-import time
+from time import monotonic as _now
 from typing import Optional, Dict, Any, Tuple
-from flask import request, current_app, g
+from flask import request, current_app, g, has_app_context
+
+
+# Indexes into a dict-store window
+_ATTEMPTS = 0
+_RESET = 1
 
 
 class RateLimiter:
     """
     Token bucket rate limiter implementation
+    
+    Counters live in Redis when a client is available, so limits are shared
+    across worker processes. Without Redis an in-process dict is used.
+    
+    The Redis path sets the window with EXPIRE ... NX, which needs Redis
+    server 7.0+ and redis-py 4.2+. Older servers reject the option and
+    abort the transaction, so every attempt() would raise.
     """
     
-    def __init__(self, cache_store=None):
+    __slots__ = ('cache', 'redis', '_ops')
+    
+    # Dict store: drop expired windows every this many attempts (power of two)
+    _SWEEP_EVERY = 1024
+    
+    def __init__(self, cache_store=None, redis=None):
         """
         Initialize rate limiter
         
         Args:
-            cache_store: Cache backend for storing rate limit data
+            cache_store: Dict-like store used when Redis is not available
+            redis: Redis client, defaults to current_app.extensions['redis']
         """
-        self.cache = cache_store or {}  # Simple dict cache for now
+        self.cache = cache_store if cache_store is not None else {}
+        self.redis = redis
+        self._ops = 0
+    
+    def _redis_client(self):
+        """
+        Get the Redis client, if one is configured
+        
+        Returns:
+            Redis client or None
+        """
+        if self.redis is not None:
+            return self.redis
+        if has_app_context():
+            return current_app.extensions.get('redis')
+        return None
     
     def attempt(self, key: str, max_attempts: int, decay_minutes: int = 1) -> bool:
         """
@@ -36,30 +69,53 @@ class RateLimiter:
         Returns:
             bool: True if attempt is allowed
         """
-        now = time.time()
+        redis = self._redis_client()
+        if redis is not None:
+            # INCR and EXPIRE NX run atomically in one round trip
+            pipe = redis.pipeline()
+            pipe.incr(key)
+            pipe.expire(key, decay_minutes * 60, nx=True)
+            count, _ = pipe.execute()
+            return count <= max_attempts
+        
+        now = _now()
         decay_seconds = decay_minutes * 60
         
-        # Get current attempts data
-        attempts_data = self.cache.get(key, {
-            'attempts': 0,
-            'reset_time': now + decay_seconds
-        })
+        self._ops += 1
+        if not self._ops & (self._SWEEP_EVERY - 1):
+            self._sweep(now)
         
-        # Check if window has expired
-        if now >= attempts_data['reset_time']:
-            attempts_data = {
-                'attempts': 0,
-                'reset_time': now + decay_seconds
-            }
+        # Windows are [attempts, reset_time] pairs
+        window = self.cache.get(key)
+        
+        # Start a new window if there is none or it has expired
+        if window is None or now >= window[_RESET]:
+            window = [0, now + decay_seconds]
         
         # Check if under limit
-        if attempts_data['attempts'] < max_attempts:
-            attempts_data['attempts'] += 1
-            self.cache[key] = attempts_data
+        if window[_ATTEMPTS] < max_attempts:
+            window[_ATTEMPTS] += 1
+            self.cache[key] = window
             return True
         
         return False
     
+    def _sweep(self, now: float):
+        """
+        Remove expired windows from the dict store
+        
+        Without this, keys that are never attempted again stay forever.
+        The default limiter is shared by every request thread, so this
+        snapshots the items and tolerates keys cleared concurrently.
+        
+        Args:
+            now: Current monotonic time
+        """
+        cache = self.cache
+        for key, data in list(cache.items()):
+            if data[_RESET] <= now:
+                cache.pop(key, None)
+    
     def too_many_attempts(self, key: str, max_attempts: int, decay_minutes: int = 1) -> bool:
         """
         Check if there are too many attempts for a key
@@ -72,7 +128,7 @@ class RateLimiter:
         Returns:
             bool: True if too many attempts
         """
-        return not self.attempt(key, max_attempts, decay_minutes)
+        return self.hits(key) >= max_attempts
     
     def hits(self, key: str) -> int:
         """
@@ -84,8 +140,14 @@ class RateLimiter:
         Returns:
             int: Number of hits
         """
-        attempts_data = self.cache.get(key, {'attempts': 0})
-        return attempts_data['attempts']
+        redis = self._redis_client()
+        if redis is not None:
+            return int(redis.get(key) or 0)
+        
+        window = self.cache.get(key)
+        if window is None or _now() >= window[_RESET]:
+            return 0
+        return window[_ATTEMPTS]
     
     def available_in(self, key: str) -> int:
         """
@@ -97,13 +159,15 @@ class RateLimiter:
         Returns:
             int: Seconds until reset
         """
-        attempts_data = self.cache.get(key)
-        if not attempts_data:
+        redis = self._redis_client()
+        if redis is not None:
+            return max(0, redis.ttl(key))
+        
+        window = self.cache.get(key)
+        if window is None:
             return 0
         
-        now = time.time()
-        reset_time = attempts_data.get('reset_time', now)
-        return max(0, int(reset_time - now))
+        return max(0, int(window[_RESET] - _now()))
     
     def clear(self, key: str):
         """
@@ -112,6 +176,11 @@ class RateLimiter:
         Args:
             key: Rate limit key to clear
         """
+        redis = self._redis_client()
+        if redis is not None:
+            redis.delete(key)
+            return
+        
         self.cache.pop(key, None)
     
     def reset_attempts(self, key: str):
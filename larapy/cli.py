@@ -51,30 +51,4 @@ def init():
 
 
 if __name__ == '__main__':
-    cli()"""
-    pass
-
-
-@main.command()
-@click.option('--config', '-c', help='Configuration file path')
-def init(config):
-    """Initialize a new Larapy application."""
-    click.echo("Initializing Larapy application...")
-    
-    app = LarapyApp()
-    if config:
-        click.echo(f"Loading configuration from: {config}")
-    
-    app.initialize()
-    click.echo("✓ Larapy application initialized successfully!")
-
-
-@main.command()
-def version():
-    """Show version information."""
-    from larapy import __version__
-    click.echo(f"Larapy version {__version__}")
-
-
-if __name__ == '__main__':
-    main()
+    cli()
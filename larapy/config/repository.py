@@ -1,8 +1,14 @@
 import os
 import json
+import logging
 from typing import Any, Dict
 from dotenv import load_dotenv
 
+logger = logging.getLogger('larapy.config')
+
+# Sentinel for a configuration key that is not set
+_MISSING = object()
+
 class Repository:
     """Configuration Repository"""
     
@@ -21,10 +27,12 @@ class Repository:
         if not os.path.exists(self._config_path):
             return
         
-        for filename in os.listdir(self._config_path):
-            if filename.endswith('.py'):
-                module_name = filename[:-3]  # Remove .py extension
-                self._load_config_file(module_name)
+        with os.scandir(self._config_path) as entries:
+            module_names = sorted(entry.name[:-3] for entry in entries  # Remove .py extension
+                                  if entry.name.endswith('.py') and entry.is_file())
+        
+        for module_name in module_names:
+            self._load_config_file(module_name)
     
     def _load_config_file(self, name: str):
         """Load a specific configuration file"""
@@ -44,30 +52,27 @@ class Repository:
             
             self._items[name] = config
             
-        except Exception as e:
-            print(f"Failed to load config file {name}: {e}")
+        except Exception:
+            logger.exception("Failed to load config file %s", name)
     
-    def get(self, key: str, default: Any = None) -> Any:
-        """Get a configuration value using dot notation"""
+    def _lookup(self, key: str) -> Any:
+        """Walk the nested configuration for a dot-notation key, or return _MISSING"""
         keys = key.split('.')
-        
-        if len(keys) == 1:
-            return self._items.get(keys[0], default)
-        
-        config_name = keys[0]
-        if config_name not in self._items:
-            return default
-        
-        value = self._items[config_name]
+        value = self._items.get(keys[0], _MISSING)
         
         for k in keys[1:]:
             if isinstance(value, dict) and k in value:
                 value = value[k]
             else:
-                return default
+                return _MISSING
         
         return value
     
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a configuration value using dot notation"""
+        value = self._lookup(key)
+        return default if value is _MISSING else value
+    
     def set(self, key: str, value: Any):
         """Set a configuration value"""
         keys = key.split('.')
@@ -91,11 +96,7 @@ class Repository:
     
     def has(self, key: str) -> bool:
         """Determine if the given configuration value exists"""
-        try:
-            self.get(key)
-            return True
-        except:
-            return False
+        return self._lookup(key) is not _MISSING
     
     def all(self) -> Dict[str, Any]:
         """Get all configuration items"""
@@ -6,20 +6,102 @@ Follows Laravel's security configuration structure.
 """
 
 import os
-from typing import Dict, Any, List
+import re
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping
 
+# Content Security Policy presets, interned so every config build and
+# consumer shares one object per policy
+_CSP_STRICT = sys.intern("default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self'; connect-src 'self'; frame-src 'none'; object-src 'none'; base-uri 'self';")
+_CSP_MODERATE = sys.intern("default-src 'self' https:; script-src 'self' 'unsafe-inline' https:; style-src 'self' 'unsafe-inline' https:; img-src 'self' data: https:; font-src 'self' https:; connect-src 'self' https:;")
+_CSP_PERMISSIVE = sys.intern("default-src 'self' 'unsafe-inline' 'unsafe-eval' data: https:;")
+_CSP_PRESETS = {
+    'strict': _CSP_STRICT,
+    'moderate': _CSP_MODERATE,
+    'permissive': _CSP_PERMISSIVE,
+}
 
-def get_security_config() -> Dict[str, Any]:
+# Comma and the whitespace around it, for comma-separated env lists
+_LIST_SEPARATOR = re.compile(r'\s*,\s*')
+
+# Bound once; os.environ is mutated in place, never rebound
+_getenv = os.environ.get
+
+
+@lru_cache(maxsize=None)
+def get_security_config() -> Mapping[str, Any]:
     """
     Get security configuration with environment-based settings
     
+    The configuration is built once per process, on first use so that a
+    .env file loaded at boot is honoured, and shared read-only by every
+    caller: nested sections are read-only mappings and lists are tuples.
+    Use get_security_config_dict() for a plain, JSON-serialisable copy.
+    Call reset_security_config() after changing the environment.
+    
+    Returns:
+        Mapping[str, Any]: Read-only security configuration
+    """
+    return _freeze(_build_security_config())
+
+
+def get_security_config_dict() -> Dict[str, Any]:
+    """
+    Get a mutable copy of the security configuration
+    
+    Returns:
+        Dict[str, Any]: Security configuration as plain dicts and lists
+    """
+    return _thaw(get_security_config())
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Recursively make a configuration value read-only
+    
+    Args:
+        value: Configuration value
+        
+    Returns:
+        Any: dicts as read-only mappings, lists as tuples, others unchanged
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _thaw(value: Any) -> Any:
+    """
+    Recursively copy a frozen configuration value into dicts and lists
+    
+    Args:
+        value: Value returned by _freeze()
+        
+    Returns:
+        Any: read-only mappings as dicts, tuples as lists, others unchanged
+    """
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _build_security_config() -> Dict[str, Any]:
+    """
+    Build the security configuration from the environment
+    
     Returns:
         Dict[str, Any]: Security configuration
     """
     return {
         # Encryption settings
         'encryption': {
-            'key': os.getenv('APP_KEY', ''),
+            'key': _getenv('APP_KEY', ''),
             'cipher': 'fernet',  # or 'aes'
         },
         
@@ -43,21 +125,21 @@ def get_security_config() -> Dict[str, Any]:
             'allowed_methods': _parse_env_list('CORS_ALLOWED_METHODS', ['*']),
             'allowed_headers': _parse_env_list('CORS_ALLOWED_HEADERS', ['*']),
             'exposed_headers': _parse_env_list('CORS_EXPOSED_HEADERS', []),
-            'max_age': int(os.getenv('CORS_MAX_AGE', '0')),
-            'supports_credentials': os.getenv('CORS_SUPPORTS_CREDENTIALS', 'false').lower() == 'true',
+            'max_age': _env_int('CORS_MAX_AGE', 0),
+            'supports_credentials': _env_bool('CORS_SUPPORTS_CREDENTIALS', False),
         },
         
         # Rate limiting settings
         'rate_limiting': {
-            'default': os.getenv('RATE_LIMIT_DEFAULT', '60,1'),  # 60 requests per minute
-            'api': os.getenv('RATE_LIMIT_API', '1000,60'),       # 1000 per hour
-            'login': os.getenv('RATE_LIMIT_LOGIN', '5,1'),       # 5 login attempts per minute
-            'register': os.getenv('RATE_LIMIT_REGISTER', '10,1'), # 10 registrations per minute
+            'default': _getenv('RATE_LIMIT_DEFAULT', '60,1'),  # 60 requests per minute
+            'api': _getenv('RATE_LIMIT_API', '1000,60'),       # 1000 per hour
+            'login': _getenv('RATE_LIMIT_LOGIN', '5,1'),       # 5 login attempts per minute
+            'register': _getenv('RATE_LIMIT_REGISTER', '10,1'), # 10 registrations per minute
         },
         
         # Cookie encryption settings
         'cookies': {
-            'encrypt': os.getenv('ENCRYPT_COOKIES', 'true').lower() == 'true',
+            'encrypt': _env_bool('ENCRYPT_COOKIES', True),
             'exclude': [
                 'cookie_consent',
                 'session',
@@ -73,25 +155,25 @@ def get_security_config() -> Dict[str, Any]:
         
         # Security headers
         'security_headers': {
-            'x_frame_options': os.getenv('X_FRAME_OPTIONS', 'SAMEORIGIN'),
-            'x_content_type_options': os.getenv('X_CONTENT_TYPE_OPTIONS', 'nosniff'),
-            'x_xss_protection': os.getenv('X_XSS_PROTECTION', '1; mode=block'),
-            'strict_transport_security': os.getenv('HSTS_HEADER', 'max-age=31536000; includeSubDomains'),
-            'content_security_policy': os.getenv('CSP_HEADER', "default-src 'self'"),
-            'referrer_policy': os.getenv('REFERRER_POLICY', 'strict-origin-when-cross-origin'),
-            'permissions_policy': os.getenv('PERMISSIONS_POLICY', 'geolocation=(), microphone=(), camera=()'),
+            'x_frame_options': _getenv('X_FRAME_OPTIONS', 'SAMEORIGIN'),
+            'x_content_type_options': _getenv('X_CONTENT_TYPE_OPTIONS', 'nosniff'),
+            'x_xss_protection': _getenv('X_XSS_PROTECTION', '1; mode=block'),
+            'strict_transport_security': _getenv('HSTS_HEADER', 'max-age=31536000; includeSubDomains'),
+            'content_security_policy': _getenv('CSP_HEADER', "default-src 'self'"),
+            'referrer_policy': _getenv('REFERRER_POLICY', 'strict-origin-when-cross-origin'),
+            'permissions_policy': _getenv('PERMISSIONS_POLICY', 'geolocation=(), microphone=(), camera=()'),
         },
         
         # Password hashing
         'hashing': {
-            'driver': os.getenv('HASH_DRIVER', 'bcrypt'),
+            'driver': _getenv('HASH_DRIVER', 'bcrypt'),
             'bcrypt': {
-                'rounds': int(os.getenv('BCRYPT_ROUNDS', '12')),
+                'rounds': _env_int('BCRYPT_ROUNDS', 12),
             },
             'argon2': {
-                'memory_cost': int(os.getenv('ARGON2_MEMORY', '65536')),  # 64MB
-                'time_cost': int(os.getenv('ARGON2_TIME', '4')),
-                'parallelism': int(os.getenv('ARGON2_THREADS', '3')),
+                'memory_cost': _env_int('ARGON2_MEMORY', 65536),  # 64MB
+                'time_cost': _env_int('ARGON2_TIME', 4),
+                'parallelism': _env_int('ARGON2_THREADS', 3),
             },
         },
         
@@ -126,15 +208,15 @@ def get_security_config() -> Dict[str, Any]:
                     'throttle': 60,
                 },
             },
-            'password_timeout': int(os.getenv('AUTH_PASSWORD_TIMEOUT', '10800')),  # 3 hours
+            'password_timeout': _env_int('AUTH_PASSWORD_TIMEOUT', 10800),  # 3 hours
         },
         
         # Session security
         'session': {
-            'encrypt': os.getenv('SESSION_ENCRYPT', 'false').lower() == 'true',
-            'fingerprint': os.getenv('SESSION_FINGERPRINT', 'true').lower() == 'true',
-            'ip_validation': os.getenv('SESSION_IP_VALIDATION', 'true').lower() == 'true',
-            'user_agent_validation': os.getenv('SESSION_USER_AGENT_VALIDATION', 'true').lower() == 'true',
+            'encrypt': _env_bool('SESSION_ENCRYPT', False),
+            'fingerprint': _env_bool('SESSION_FINGERPRINT', True),
+            'ip_validation': _env_bool('SESSION_IP_VALIDATION', True),
+            'user_agent_validation': _env_bool('SESSION_USER_AGENT_VALIDATION', True),
             'regenerate_on_login': True,
         },
         
@@ -153,18 +235,52 @@ def get_security_config() -> Dict[str, Any]:
         
         # URL signing
         'signed_urls': {
-            'lifetime': int(os.getenv('SIGNED_URL_LIFETIME', '3600')),  # 1 hour
+            'lifetime': _env_int('SIGNED_URL_LIFETIME', 3600),  # 1 hour
         },
         
         # Content Security Policy presets
-        'csp_presets': {
-            'strict': "default-src 'self'; script-src 'self'; style-src 'self' 'unsafe-inline'; img-src 'self' data:; font-src 'self'; connect-src 'self'; frame-src 'none'; object-src 'none'; base-uri 'self';",
-            'moderate': "default-src 'self' https:; script-src 'self' 'unsafe-inline' https:; style-src 'self' 'unsafe-inline' https:; img-src 'self' data: https:; font-src 'self' https:; connect-src 'self' https:;",
-            'permissive': "default-src 'self' 'unsafe-inline' 'unsafe-eval' data: https:;",
-        },
+        'csp_presets': dict(_CSP_PRESETS),
     }
 
 
+def _env_int(name: str, default: int) -> int:
+    """
+    Read an integer environment variable
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+        
+    Returns:
+        int: Parsed value
+    """
+    value = _getenv(name)
+    return default if value is None else int(value)
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """
+    Read a boolean environment variable ('true' is True)
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+        
+    Returns:
+        bool: Parsed value
+    """
+    value = _getenv(name)
+    return default if value is None else value.lower() == 'true'
+
+
+def reset_security_config() -> None:
+    """
+    Discard the cached security configuration so the environment is
+    re-read on next use
+    """
+    get_security_config.cache_clear()
+
+
 def _parse_env_list(env_var: str, default: List[str]) -> List[str]:
     """
     Parse comma-separated environment variable into list
@@ -176,11 +292,11 @@ def _parse_env_list(env_var: str, default: List[str]) -> List[str]:
     Returns:
         List[str]: Parsed list
     """
-    value = os.getenv(env_var)
+    value = _getenv(env_var)
     if not value:
         return default
     
-    return [item.strip() for item in value.split(',') if item.strip()]
+    return [item for item in _LIST_SEPARATOR.split(value.strip()) if item]
 
 
 def get_csp_policy(preset: str = 'moderate') -> str:
@@ -193,9 +309,7 @@ def get_csp_policy(preset: str = 'moderate') -> str:
     Returns:
         str: CSP policy string
     """
-    config = get_security_config()
-    presets = config['csp_presets']
-    return presets.get(preset, presets['moderate'])
+    return _CSP_PRESETS.get(preset, _CSP_MODERATE)
 
 
 # Environment variable configuration template
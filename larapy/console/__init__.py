@@ -1,12 +1,32 @@
 """Console package for Larapy"""
 
-from .command import Command
-from .kernel import ConsoleKernel
-from .application import ConsoleApplication, create_application
+from importlib import import_module
+
+# Public name -> submodule, imported on first attribute access (PEP 562) so
+# loading larapy.console.command does not also load the kernel and application
+_EXPORTS = {
+    'Command': '.command',
+    'ConsoleKernel': '.kernel',
+    'ConsoleApplication': '.application',
+    'create_application': '.application',
+}
 
 __all__ = [
     'Command',
     'ConsoleKernel',
     'ConsoleApplication',
     'create_application',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
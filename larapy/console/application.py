@@ -31,9 +31,8 @@ class ConsoleApplication:
             print(f"Error: {e}")
             return 1
 
-    def handle(self, args: List[str]) -> int:
-        """Handle console command execution (alias for run)"""
-        return self.run(args)
+    # Handle console command execution (alias for run, without an extra call)
+    handle = run
 
     def call(self, command: str, parameters: Dict[str, Any] = None) -> int:
         """Programmatically call a command"""
@@ -1,7 +1,67 @@
 """Base command class for console commands"""
 
+import os
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _fast_input(prompt: str = '') -> str:
+    """Read a line like input(), writing the prompt and flushing only once"""
+    # Interactive sessions keep input() for its readline line editing
+    if sys.stdin.isatty():
+        return input(prompt)
+    if prompt:
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith('\n') else line
+
+
+def _create_exclusive(path: str) -> int:
+    """Create and open a new file for writing, making its directory on first use"""
+    # O_EXCL makes the existence check and the create one atomic call;
+    # FileExistsError propagates to the caller
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL
+    try:
+        return os.open(path, flags, 0o666)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return os.open(path, flags, 0o666)
+
+
+def _iter_signature_params(signature: str) -> Iterator[str]:
+    """Yield the contents of each non-empty {parameter} block in a signature"""
+    find = signature.find
+    start = find('{')
+    while start != -1:
+        end = find('}', start + 1)
+        if end == -1:
+            return
+        if end > start + 1:
+            yield signature[start + 1:end]
+        start = find('{', end + 1)
+
+
+@lru_cache(maxsize=None)
+def _command_name_from_signature(signature: str) -> str:
+    """Get the command name, the first word of a signature"""
+    return signature.split(None, 1)[0] if signature else ''
+
+
+@lru_cache(maxsize=None)
+def _argument_positions(signature: str) -> Dict[str, int]:
+    """Map each positional argument name declared in a signature to its position"""
+    positions = {}
+    for param in _iter_signature_params(signature):
+        # "name? : Description" / "name=default : Description" / "--option"
+        name = param.partition(':')[0].strip()
+        if name[:2] != '--':
+            positions.setdefault(name.partition('=')[0].rstrip('?*'), len(positions))
+    return positions
 
 
 class Command(ABC):
@@ -18,6 +78,15 @@ class Command(ABC):
     def __init__(self, app=None):
         self.app = app
 
+    def get_name(self) -> str:
+        """Get the command name from the signature, or the class name without its Command suffix"""
+        name = _command_name_from_signature(self.signature)
+        if name:
+            return name
+        
+        name = self.__class__.__name__.lower()
+        return name[:-7] if name.endswith('command') else name
+
     @abstractmethod
     def handle(self) -> int:
         """Execute the command"""
@@ -38,8 +107,12 @@ class Command(ABC):
 
     def argument(self, name: str, default: Any = None) -> Any:
         """Get command argument"""
-        # Simple argument parsing - first argument is position 0, etc.
-        args = getattr(self, '_args', [])
+        # Positional arguments map onto the {arguments} declared in the signature
+        args, positional, _ = self._parsed_input()
+        index = _argument_positions(self.signature).get(name)
+        
+        if index is not None:
+            return positional[index] if index < len(positional) else default
         
         if name == 'name' and len(args) > 0:
             return args[0]
@@ -48,20 +121,43 @@ class Command(ABC):
 
     def option(self, name: str, default: Any = False) -> Any:
         """Get command option"""
-        # Parse options from arguments
+        return self._parsed_input()[2].get(name, default)
+
+    def _parsed_input(self):
+        """Split the arguments into positionals and options, once per argument list"""
         args = getattr(self, '_args', [])
+        parsed = getattr(self, '_parsed', None)
         
-        # Look for --option or --option=value patterns
-        for arg in args:
-            if arg.startswith('--'):
-                if arg == f'--{name}':
-                    # Boolean flag option
-                    return True
-                elif arg.startswith(f'--{name}='):
-                    # Option with value
-                    return arg.split('=', 1)[1]
+        if parsed is None or parsed[0] is not args:
+            positional = []
+            options = {}
+            for arg in args:
+                if arg.startswith('--'):
+                    # --flag is a boolean option, --option=value carries a value;
+                    # the first occurrence wins
+                    option, has_value, value = arg[2:].partition('=')
+                    options.setdefault(option, value if has_value else True)
+                else:
+                    positional.append(arg)
+            parsed = self._parsed = (args, positional, options)
         
-        return default
+        return parsed
+
+    def _write_new_file(self, path: str, content: str) -> bool:
+        """Write content to a new UTF-8 file, returning False if the file already exists"""
+        try:
+            fd = _create_exclusive(path)
+        except FileExistsError:
+            return False
+        
+        # Encode once and write straight to the descriptor, no text-mode wrapper
+        data = memoryview(content.encode('utf-8'))
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        return True
 
     def info(self, message: str):
         """Print info message"""
@@ -85,9 +181,9 @@ class Command(ABC):
 
     def ask(self, question: str) -> str:
         """Ask user for input"""
-        return input(f"{question}: ")
+        return _fast_input(f"{question}: ")
 
     def confirm(self, question: str) -> bool:
         """Ask user for confirmation"""
-        answer = input(f"{question} (y/N): ").lower()
+        answer = _fast_input(f"{question} (y/N): ").lower()
         return answer in ['y', 'yes']
\ No newline at end of file
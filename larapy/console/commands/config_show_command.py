@@ -1,10 +1,27 @@
 """Config show console command"""
 
 import os
+import re
+import sys
 import importlib.util
-from typing import Optional, Any, Dict
+from functools import lru_cache
+from typing import Optional, Any, Dict, List
 from ...console.command import Command
 
+# Substrings that mark a configuration key as holding a secret; matched against
+# the lowercased key, which is much cheaper for sre than re.IGNORECASE
+_SENSITIVE_RE = re.compile(r'(?:password|secret|token|api_key|private|credential|auth|cert|key)')
+
+# Value types config:show can render
+_SERIALIZABLE_BASES = (str, int, float, bool, list, dict, type(None))
+_SERIALIZABLE_TYPES = frozenset(_SERIALIZABLE_BASES)
+
+
+@lru_cache(maxsize=1024)
+def _is_sensitive(key: str) -> bool:
+    """Check a key against _SENSITIVE_RE; key names repeat across files and nesting levels"""
+    return _SENSITIVE_RE.search(key.lower()) is not None
+
 
 class ConfigShowCommand(Command):
     """Display configuration values"""
@@ -44,44 +61,47 @@ class ConfigShowCommand(Command):
             self.error("Config directory not found.")
             return {}
         
-        # Load all Python config files
-        for filename in os.listdir(config_dir):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                config_name = filename[:-3]  # Remove .py extension
-                config_path = os.path.join(config_dir, filename)
-                
-                try:
-                    # Load the config module
-                    spec = importlib.util.spec_from_file_location(config_name, config_path)
-                    config_module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(config_module)
-                    
-                    # Extract configuration values (uppercase attributes)
-                    module_config = {}
-                    for attr_name in dir(config_module):
-                        if not attr_name.startswith('_'):
-                            attr_value = getattr(config_module, attr_name)
-                            # Only include serializable values
-                            if self._is_serializable(attr_value):
-                                module_config[attr_name.lower()] = attr_value
-                    
-                    config_data[config_name] = module_config
-                    
-                except Exception as e:
-                    self.comment(f"Could not load config file {filename}: {str(e)}")
+        # Load all Python config files, in name order so the result is already sorted
+        with os.scandir(config_dir) as entries:
+            config_files = [
+                entry for entry in entries
+                if entry.name.endswith('.py') and not entry.name.startswith('__') and entry.is_file()
+            ]
+        
+        config_files.sort(key=lambda entry: entry.name)
+        
+        for entry in config_files:
+            filename = entry.name
+            config_name = filename[:-3]  # Remove .py extension
+            
+            try:
+                config_data[config_name] = self._load_config_file(config_name, entry)
+            except Exception as e:
+                self.comment(f"Could not load config file {filename}: {str(e)}")
         
         return config_data
 
+    def _load_config_file(self, config_name: str, entry: os.DirEntry) -> Dict[str, Any]:
+        """Load a config file and extract its displayable values, sorted by key"""
+        # Load the config module
+        spec = importlib.util.spec_from_file_location(config_name, entry.path)
+        config_module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(config_module)
+        
+        # Extract configuration values (uppercase attributes)
+        module_config = {}
+        for attr_name, attr_value in vars(config_module).items():
+            # Only include public, serializable values
+            if not attr_name.startswith('_') and self._is_serializable(attr_value):
+                module_config[attr_name.lower()] = attr_value
+        
+        return dict(sorted(module_config.items()))
+
     def _is_serializable(self, value: Any) -> bool:
         """Check if a value is serializable for display"""
-        try:
-            # Test basic types
-            if isinstance(value, (str, int, float, bool, list, dict, type(None))):
-                return True
-            # Skip functions, classes, modules, etc.
-            return False
-        except:
-            return False
+        # Exact built-in types hit the set; subclasses (e.g. OrderedDict) fall back
+        # to isinstance. Functions, classes, modules, etc. are skipped
+        return type(value) in _SERIALIZABLE_TYPES or isinstance(value, _SERIALIZABLE_BASES)
 
     def _show_specific_config(self, config_data: Dict[str, Any], key: str):
         """Show a specific configuration key"""
@@ -103,8 +123,10 @@ class ConfigShowCommand(Command):
         self.line("")
         self.info(f"Configuration: {key}")
         self.line("-" * (len(key) + 15))
-        self._display_value(current_data, indent=0)
-        self.line("")
+        out = []
+        self._render_value(current_data, 0, out, key=keys[-1])
+        out.append("")
+        self._write(out)
 
     def _show_all_config(self, config_data: Dict[str, Any]):
         """Show all configuration"""
@@ -116,83 +138,78 @@ class ConfigShowCommand(Command):
         self.info("Application Configuration:")
         self.line("=" * 50)
         
-        for config_file, config_values in sorted(config_data.items()):
+        for config_file, config_values in config_data.items():
             self.line("")
             self.success(f"[{config_file}]")
-            self.line("-" * (len(config_file) + 4))
             
+            # Render the whole file's values, then write them in one call
+            out = ["-" * (len(config_file) + 4)]
             if isinstance(config_values, dict):
-                for key, value in sorted(config_values.items()):
-                    self.line(f"  {key}:")
-                    self._display_value(value, indent=4)
+                for key, value in config_values.items():
+                    out.append(f"  {key}:")
+                    self._render_value(value, 4, out, key=key)
             else:
-                self._display_value(config_values, indent=2)
+                self._render_value(config_values, 2, out)
+            self._write(out)
         
         self.line("")
 
-    def _display_value(self, value: Any, indent: int = 0):
-        """Display a configuration value with proper formatting"""
+    def _render_value(self, value: Any, indent: int, out: List[str], key: Optional[str] = None):
+        """Append the formatted lines of a configuration value to out"""
         prefix = " " * indent
         
         if value is None:
-            self.line(f"{prefix}null")
+            out.append(f"{prefix}null")
         elif isinstance(value, bool):
-            self.line(f"{prefix}{str(value).lower()}")
+            out.append(f"{prefix}{str(value).lower()}")
         elif isinstance(value, str):
             # Handle sensitive data
-            if self._is_sensitive_key(str(value)):
-                self.line(f"{prefix}\"***HIDDEN***\"")
+            if key is not None and self._is_sensitive_key(key):
+                out.append(f"{prefix}\"***HIDDEN***\"")
             else:
-                self.line(f"{prefix}\"{value}\"")
+                out.append(f"{prefix}\"{value}\"")
         elif isinstance(value, (int, float)):
-            self.line(f"{prefix}{value}")
+            out.append(f"{prefix}{value}")
         elif isinstance(value, list):
             if not value:
-                self.line(f"{prefix}[]")
+                out.append(f"{prefix}[]")
             else:
-                self.line(f"{prefix}[")
+                out.append(f"{prefix}[")
                 for i, item in enumerate(value):
                     comma = "," if i < len(value) - 1 else ""
                     if isinstance(item, str):
-                        self.line(f"{prefix}  \"{item}\"{comma}")
+                        out.append(f"{prefix}  \"{item}\"{comma}")
                     else:
-                        self.line(f"{prefix}  {item}{comma}")
-                self.line(f"{prefix}]")
+                        out.append(f"{prefix}  {item}{comma}")
+                out.append(f"{prefix}]")
         elif isinstance(value, dict):
             if not value:
-                self.line(f"{prefix}{{}}")
+                out.append(f"{prefix}{{}}")
             else:
-                self.line(f"{prefix}{{")
+                out.append(f"{prefix}{{")
                 items = list(value.items())
                 for i, (k, v) in enumerate(items):
                     comma = "," if i < len(items) - 1 else ""
-                    self.line(f"{prefix}  \"{k}\": ", end="")
                     if isinstance(v, str):
                         if self._is_sensitive_key(k):
-                            print(f"\"***HIDDEN***\"{comma}")
+                            out.append(f"{prefix}  \"{k}\": \"***HIDDEN***\"{comma}")
                         else:
-                            print(f"\"{v}\"{comma}")
+                            out.append(f"{prefix}  \"{k}\": \"{v}\"{comma}")
                     elif isinstance(v, (dict, list)):
-                        print("")
-                        self._display_value(v, indent + 4)
+                        out.append(f"{prefix}  \"{k}\": ")
+                        self._render_value(v, indent + 4, out)
                         if comma:
-                            self.line(f"{prefix}  {comma}")
+                            out.append(f"{prefix}  {comma}")
                     else:
-                        print(f"{v}{comma}")
-                self.line(f"{prefix}}}")
+                        out.append(f"{prefix}  \"{k}\": {v}{comma}")
+                out.append(f"{prefix}}}")
         else:
-            self.line(f"{prefix}{str(value)}")
+            out.append(f"{prefix}{str(value)}")
 
     def _is_sensitive_key(self, key: str) -> bool:
         """Check if a configuration key contains sensitive data"""
-        sensitive_keywords = [
-            'password', 'secret', 'key', 'token', 'api_key',
-            'private', 'credential', 'auth', 'cert'
-        ]
-        
-        key_lower = key.lower()
-        return any(keyword in key_lower for keyword in sensitive_keywords)
+        return _is_sensitive(key)
 
-    def line(self, message: str = "", end: str = "\\n"):
-        """Print a line with optional ending"""
-        print(message, end=end)
\ No newline at end of file
+    def _write(self, lines: List[str]):
+        """Write lines to stdout in a single call"""
+        sys.stdout.write("\n".join(lines) + "\n")
\ No newline at end of file
@@ -1,108 +1,65 @@
 """Make command console command"""
 
 import os
+import re
+from functools import lru_cache
 from typing import Optional
 from ...console.command import Command
 
-
-class MakeCommandCommand(Command):
-    """Create a new console command"""
+# Words of a CamelCase (or lowercase) name
+_CAMEL_WORD_RE = re.compile(r'[A-Z][a-z]*|[a-z]+')
+
+_UPPER = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+_LOWER = frozenset('abcdefghijklmnopqrstuvwxyz')
+_LOWER_OR_DIGIT = _LOWER | frozenset('0123456789')
+
+
+def _snake_case(name: str) -> str:
+    """Convert CamelCase to snake_case in a single pass"""
+    # A capital gets an underscore before it when it starts a capitalised word
+    # (next char lowercase) or follows a lowercase letter or digit
+    out = []
+    last = len(name) - 1
+    for i, char in enumerate(name):
+        if i and char in _UPPER and (
+            name[i - 1] in _LOWER_OR_DIGIT or (i < last and name[i + 1] in _LOWER)
+        ):
+            out.append('_')
+        out.append(char)
+    return ''.join(out).lower()
+
+
+@lru_cache(maxsize=1024)
+def _command_class_name(name: str) -> str:
+    """Clean and format a command class name"""
+    # Add Command suffix if not present
+    if not name.endswith('Command'):
+        name = name + 'Command'
     
-    signature = "make:command {name : The name of the command class} {--command= : The terminal command that should be assigned}"
-    description = "Create a new Artisan command"
-
-    def handle(self) -> int:
-        """Execute the make:command command"""
-        
-        # Get command name from arguments
-        command_name = self.argument('name')
-        if not command_name:
-            command_name = self.ask("What should the command be named?")
-        
-        if not command_name:
-            self.error("Command name is required.")
-            return 1
-
-        # Clean command name
-        command_name = self._clean_command_name(command_name)
-
-        # Get the terminal command name
-        terminal_command = self.option('command')
-        if not terminal_command:
-            # Generate a default command name based on the class name
-            terminal_command = self._generate_terminal_command(command_name)
-
-        try:
-            # Create the command file
-            self._create_command_file(command_name, terminal_command)
-            return 0
-            
-        except Exception as e:
-            self.error(f"Failed to create command: {str(e)}")
-            return 1
-
-    def _clean_command_name(self, name: str) -> str:
-        """Clean and format command name"""
-        # Add Command suffix if not present
-        if not name.endswith('Command'):
-            name = name + 'Command'
-        
-        # Remove Command suffix for processing
-        base_name = name[:-7] if name.endswith('Command') else name
-        
-        # Split CamelCase and capitalize each word properly
-        import re
-        words = re.findall(r'[A-Z][a-z]*|[a-z]+', base_name)
-        cleaned_name = ''.join(word.capitalize() for word in words)
-        
-        return cleaned_name + 'Command'
-
-    def _generate_terminal_command(self, command_name: str) -> str:
-        """Generate a terminal command name from the class name"""
-        # Remove 'Command' suffix and convert to snake_case
-        base_name = command_name.replace('Command', '')
-        
-        # Convert CamelCase to snake_case
-        import re
-        snake_case = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', base_name)
-        snake_case = re.sub('([a-z0-9])([A-Z])', r'\1_\2', snake_case).lower()
-        
-        return f"app:{snake_case}"
-
-    def _create_command_file(self, command_name: str, terminal_command: str):
-        """Create the command file"""
-        # Create commands directory if it doesn't exist
-        commands_dir = "app/Console/Commands"
-        os.makedirs(commands_dir, exist_ok=True)
-
-        # Create command file path
-        command_file = os.path.join(commands_dir, f"{command_name}.py")
-
-        # Check if file already exists
-        if os.path.exists(command_file):
-            self.error(f"Command {command_name} already exists.")
-            return
+    # Remove Command suffix for processing
+    base_name = name[:-7]
+    
+    # Split CamelCase and capitalize each word properly
+    words = _CAMEL_WORD_RE.findall(base_name)
+    cleaned_name = ''.join([word.capitalize() for word in words])
+    
+    return cleaned_name + 'Command'
 
-        # Generate command content
-        content = self._get_command_stub(command_name, terminal_command)
 
-        # Write command file
-        with open(command_file, 'w') as f:
-            f.write(content)
+@lru_cache(maxsize=1024)
+def _terminal_command_name(command_name: str) -> str:
+    """Generate a terminal command name from a command class name"""
+    # Remove 'Command' suffix and convert to snake_case
+    base_name = command_name.replace('Command', '')
+    
+    return f"app:{_snake_case(base_name)}"
 
-        self.success(f"Command {command_name} created successfully.")
-        self.info(f"File: {command_file}")
-        self.comment(f"Don't forget to register your command in the console kernel")
-        self.comment(f"Terminal command: {terminal_command}")
 
-    def _get_command_stub(self, command_name: str, terminal_command: str) -> str:
-        """Get the command stub content"""
-        class_name_without_suffix = command_name[:-7] if command_name.endswith('Command') else command_name
-        
-        return f'''"""
+# app/Console/Commands/<Name>.py template; literal braces are doubled for format_map
+_COMMAND_STUB = '''"""
 {command_name}
 
-Custom console command for {class_name_without_suffix.lower()} operations.
+Custom console command for {class_name_lower} operations.
 """
 
 import sys
@@ -116,11 +73,11 @@ class {command_name}(Command):
     """
     {command_name}
     
-    Handles {class_name_without_suffix.lower()} operations via the command line.
+    Handles {class_name_lower} operations via the command line.
     """
     
     signature = "{terminal_command} {{--option= : Optional parameter}}"
-    description = "Command description for {class_name_without_suffix.lower()}"
+    description = "Command description for {class_name_lower}"
 
     def handle(self) -> int:
         """
@@ -130,7 +87,7 @@ class {command_name}(Command):
             Exit code (0 for success, non-zero for failure)
         """
         # Add your command logic here
-        self.info("Starting {class_name_without_suffix.lower()} command...")
+        self.info("Starting {class_name_lower} command...")
         
         # Example: Get option values
         option_value = self.option('option')
@@ -151,13 +108,13 @@ class {command_name}(Command):
         # Your command implementation goes here
         try:
             # Example implementation
-            self.line("Executing {class_name_without_suffix.lower()} logic...")
+            self.line("Executing {class_name_lower} logic...")
             
             # Simulate some work
             import time
             time.sleep(1)
             
-            self.success("{class_name_without_suffix} command completed successfully!")
+            self.success("{class_name} command completed successfully!")
             return 0
             
         except Exception as e:
@@ -188,4 +145,80 @@ class {command_name}(Command):
             # Example: ('force', 'f', 'Force the operation')
             ('option', 'o', 'Optional parameter for the command'),
         ]
-'''
\ No newline at end of file
+'''
+
+
+class MakeCommandCommand(Command):
+    """Create a new console command"""
+    
+    signature = "make:command {name : The name of the command class} {--command= : The terminal command that should be assigned}"
+    description = "Create a new Artisan command"
+
+    def handle(self) -> int:
+        """Execute the make:command command"""
+        
+        # Get command name from arguments
+        command_name = self.argument('name')
+        if not command_name:
+            command_name = self.ask("What should the command be named?")
+        
+        if not command_name:
+            self.error("Command name is required.")
+            return 1
+
+        # Clean command name
+        command_name = self._clean_command_name(command_name)
+
+        # Get the terminal command name
+        terminal_command = self.option('command')
+        if not terminal_command:
+            # Generate a default command name based on the class name
+            terminal_command = self._generate_terminal_command(command_name)
+
+        try:
+            # Create the command file
+            self._create_command_file(command_name, terminal_command)
+            return 0
+            
+        except Exception as e:
+            self.error(f"Failed to create command: {str(e)}")
+            return 1
+
+    def _clean_command_name(self, name: str) -> str:
+        """Clean and format command name"""
+        return _command_class_name(name)
+
+    def _generate_terminal_command(self, command_name: str) -> str:
+        """Generate a terminal command name from the class name"""
+        return _terminal_command_name(command_name)
+
+    def _create_command_file(self, command_name: str, terminal_command: str):
+        """Create the command file"""
+        commands_dir = "app/Console/Commands"
+
+        # Create command file path
+        command_file = os.path.join(commands_dir, f"{command_name}.py")
+
+        # Generate command content
+        content = self._get_command_stub(command_name, terminal_command)
+
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(command_file, content):
+            self.error(f"Command {command_name} already exists.")
+            return
+
+        self.success(f"Command {command_name} created successfully.")
+        self.info(f"File: {command_file}")
+        self.comment(f"Don't forget to register your command in the console kernel")
+        self.comment(f"Terminal command: {terminal_command}")
+
+    def _get_command_stub(self, command_name: str, terminal_command: str) -> str:
+        """Get the command stub content"""
+        class_name_without_suffix = command_name[:-7] if command_name.endswith('Command') else command_name
+        
+        return _COMMAND_STUB.format_map({
+            'command_name': command_name,
+            'terminal_command': terminal_command,
+            'class_name': class_name_without_suffix,
+            'class_name_lower': class_name_without_suffix.lower(),
+        })
\ No newline at end of file
@@ -1,117 +1,39 @@
 """Make controller console command"""
 
 import os
+import re
+from functools import lru_cache
 from typing import Optional
 from ...console.command import Command
 
+# Words of a CamelCase (or lowercase) name
+_CAMEL_WORD_RE = re.compile(r'[A-Z][a-z]*|[a-z]+')
 
-class MakeControllerCommand(Command):
-    """Create a new controller"""
-    
-    signature = "make:controller {name : The name of the controller} {--resource : Generate a resource controller} {--api : Generate an API controller} {--model= : Generate a resource controller for the given model}"
-    description = "Create a new controller class"
-
-    def handle(self) -> int:
-        """Execute the make:controller command"""
-        
-        # Get controller name from arguments
-        controller_name = self.argument('name')
-        if not controller_name:
-            controller_name = self.ask("What should the controller be named?")
-        
-        if not controller_name:
-            self.error("Controller name is required.")
-            return 1
-
-        # Clean controller name
-        controller_name = self._clean_controller_name(controller_name)
-
-        # Check options
-        is_resource = self.option('resource')
-        is_api = self.option('api')
-        model_name = self.option('model')
-
-        try:
-            # Create the controller file
-            self._create_controller_file(controller_name, is_resource, is_api, model_name)
-            return 0
-            
-        except Exception as e:
-            self.error(f"Failed to create controller: {str(e)}")
-            return 1
-
-    def _clean_controller_name(self, name: str) -> str:
-        """Clean and format controller name"""
-        # Add Controller suffix if not present
-        if not name.endswith('Controller'):
-            name = name + 'Controller'
-        
-        # Remove Controller suffix for processing
-        base_name = name[:-10] if name.endswith('Controller') else name
-        
-        # Split CamelCase and capitalize each word properly
-        import re
-        words = re.findall(r'[A-Z][a-z]*|[a-z]+', base_name)
-        cleaned_name = ''.join(word.capitalize() for word in words)
-        
-        return cleaned_name + 'Controller'
-
-    def _create_controller_file(self, controller_name: str, is_resource: bool = False, is_api: bool = False, model_name: Optional[str] = None):
-        """Create the controller file"""
-        # Create Controllers directory if it doesn't exist
-        controllers_dir = "app/Http/Controllers"
-        os.makedirs(controllers_dir, exist_ok=True)
-
-        # Create controller file path
-        controller_file = os.path.join(controllers_dir, f"{controller_name}.py")
-
-        # Check if file already exists
-        if os.path.exists(controller_file):
-            self.error(f"Controller {controller_name} already exists.")
-            return
 
-        # Generate controller content
-        if is_resource or model_name:
-            content = self._get_resource_controller_stub(controller_name, is_api, model_name)
-        else:
-            content = self._get_basic_controller_stub(controller_name, is_api)
+@lru_cache(maxsize=1024)
+def _controller_class_name(name: str) -> str:
+    """Clean and format a controller class name"""
+    # Add Controller suffix if not present
+    if not name.endswith('Controller'):
+        name = name + 'Controller'
+    
+    # Remove Controller suffix for processing
+    base_name = name[:-10]
+    
+    # Split CamelCase and capitalize each word properly
+    words = _CAMEL_WORD_RE.findall(base_name)
+    cleaned_name = ''.join([word.capitalize() for word in words])
+    
+    return cleaned_name + 'Controller'
 
-        # Write controller file
-        with open(controller_file, 'w') as f:
-            f.write(content)
 
-        self.success(f"Controller {controller_name} created successfully.")
-        self.info(f"File: {controller_file}")
+# Controller module template, shared by basic and resource controllers
+_CONTROLLER_STUB = '''"""{controller_name}"""
 
-    def _get_basic_controller_stub(self, controller_name: str, is_api: bool = False) -> str:
-        """Get the basic controller stub content"""
-        imports = []
-        base_class = ""
-        
-        if is_api:
-            imports.append("from larapy import Response")
-            imports.append("from flask import jsonify, request")
-        else:
-            imports.append("from larapy import Response")
-            imports.append("from flask import render_template, request")
-        
-        # Add base controller import
-        imports.append("from larapy.http.concerns.validates_requests import Controller")
-        base_class = "(Controller)"
-        
-        imports_str = "\n".join(imports)
-        
-        if is_api:
-            methods = self._get_api_basic_methods()
-        else:
-            methods = self._get_web_basic_methods()
-        
-        return f'''"""{controller_name}"""
+{imports}
 
-{imports_str}
 
-
-class {controller_name}{base_class}:
+class {controller_name}(Controller):
     """{controller_name} class"""
     
     def __init__(self):
@@ -120,50 +42,15 @@ class {controller_name}{base_class}:
 {methods}
 '''
 
-    def _get_resource_controller_stub(self, controller_name: str, is_api: bool = False, model_name: Optional[str] = None) -> str:
-        """Get the resource controller stub content"""
-        imports = []
-        base_class = ""
-        
-        if is_api:
-            imports.append("from larapy import Response")
-            imports.append("from flask import jsonify, request")
-        else:
-            imports.append("from larapy import Response")
-            imports.append("from flask import render_template, request, redirect, url_for")
-        
-        # Add base controller import
-        imports.append("from larapy.http.concerns.validates_requests import Controller")
-        base_class = "(Controller)"
-        
-        # Add model import if specified
-        if model_name:
-            imports.append(f"from app.Models.{model_name} import {model_name}")
-        
-        imports_str = "\n".join(imports)
-        
-        if is_api:
-            methods = self._get_api_resource_methods(model_name)
-        else:
-            methods = self._get_web_resource_methods(model_name)
-        
-        return f'''"""{controller_name}"""
-
-{imports_str}
 
+# Imports of each controller flavour; every controller extends the validating Controller
+_CONTROLLER_IMPORT = "from larapy.http.concerns.validates_requests import Controller"
+_API_IMPORTS = f"from larapy import Response\nfrom flask import jsonify, request\n{_CONTROLLER_IMPORT}"
+_WEB_BASIC_IMPORTS = f"from larapy import Response\nfrom flask import render_template, request\n{_CONTROLLER_IMPORT}"
+_WEB_RESOURCE_IMPORTS = f"from larapy import Response\nfrom flask import render_template, request, redirect, url_for\n{_CONTROLLER_IMPORT}"
 
-class {controller_name}{base_class}:
-    """{controller_name} class"""
-    
-    def __init__(self):
-        super().__init__()
-    
-{methods}
-'''
-
-    def _get_web_basic_methods(self) -> str:
-        """Get basic web controller methods"""
-        return '''    def index(self):
+# Methods of basic (non-resource) controllers
+_WEB_BASIC_METHODS = '''    def index(self):
         """Display the main view"""
         return render_template('index.html')
     
@@ -171,9 +58,7 @@ class {controller_name}{base_class}:
         """Display a specific resource"""
         return render_template('show.html', id=id)'''
 
-    def _get_api_basic_methods(self) -> str:
-        """Get basic API controller methods"""
-        return '''    def index(self):
+_API_BASIC_METHODS = '''    def index(self):
         """Return a JSON response"""
         return {
             'message': 'Hello from API',
@@ -188,12 +73,9 @@ class {controller_name}{base_class}:
             'status': 'success'
         }'''
 
-    def _get_web_resource_methods(self, model_name: Optional[str] = None) -> str:
-        """Get web resource controller methods"""
-        model_var = model_name.lower() if model_name else 'item'
-        model_class = model_name if model_name else 'Model'
-        
-        return f'''    def index(self):
+
+# Resource methods for web controllers
+_WEB_RESOURCE_METHODS = '''    def index(self):
         """Display a listing of the resource"""
         # {model_var}s = {model_class}.all()
         return render_template('{model_var}s/index.html')
@@ -249,12 +131,9 @@ class {controller_name}{base_class}:
         # Redirect with success message
         return redirect(url_for('{model_var}s.index'))'''
 
-    def _get_api_resource_methods(self, model_name: Optional[str] = None) -> str:
-        """Get API resource controller methods"""
-        model_var = model_name.lower() if model_name else 'item'
-        model_class = model_name if model_name else 'Model'
-        
-        return f'''    def index(self):
+
+# Resource methods for API controllers
+_API_RESOURCE_METHODS = '''    def index(self):
         """Display a listing of the resource"""
         # {model_var}s = {model_class}.all()
         return {{
@@ -315,4 +194,117 @@ class {controller_name}{base_class}:
         return {{
             'status': 'success',
             'message': f'{model_class} {{id}} deleted successfully'
-        }}, 204'''
\ No newline at end of file
+        }}, 204'''
+
+
+@lru_cache(maxsize=64)
+def _resource_methods(is_api: bool, model_name: Optional[str]) -> str:
+    """Render the resource controller methods for a model (or the generic 'item')"""
+    model_var = model_name.lower() if model_name else 'item'
+    model_class = model_name if model_name else 'Model'
+    template = _API_RESOURCE_METHODS if is_api else _WEB_RESOURCE_METHODS
+    return template.format_map({'model_var': model_var, 'model_class': model_class})
+
+
+class MakeControllerCommand(Command):
+    """Create a new controller"""
+    
+    signature = "make:controller {name : The name of the controller} {--resource : Generate a resource controller} {--api : Generate an API controller} {--model= : Generate a resource controller for the given model}"
+    description = "Create a new controller class"
+
+    def handle(self) -> int:
+        """Execute the make:controller command"""
+        
+        # Get controller name from arguments
+        controller_name = self.argument('name')
+        if not controller_name:
+            controller_name = self.ask("What should the controller be named?")
+        
+        if not controller_name:
+            self.error("Controller name is required.")
+            return 1
+
+        # Clean controller name
+        controller_name = self._clean_controller_name(controller_name)
+
+        # Check options
+        is_resource = self.option('resource')
+        is_api = self.option('api')
+        model_name = self.option('model')
+
+        try:
+            # Create the controller file
+            self._create_controller_file(controller_name, is_resource, is_api, model_name)
+            return 0
+            
+        except Exception as e:
+            self.error(f"Failed to create controller: {str(e)}")
+            return 1
+
+    def _clean_controller_name(self, name: str) -> str:
+        """Clean and format controller name"""
+        return _controller_class_name(name)
+
+    def _create_controller_file(self, controller_name: str, is_resource: bool = False, is_api: bool = False, model_name: Optional[str] = None):
+        """Create the controller file"""
+        controllers_dir = "app/Http/Controllers"
+
+        # Create controller file path
+        controller_file = os.path.join(controllers_dir, f"{controller_name}.py")
+
+        # Generate controller content
+        if is_resource or model_name:
+            content = self._get_resource_controller_stub(controller_name, is_api, model_name)
+        else:
+            content = self._get_basic_controller_stub(controller_name, is_api)
+
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(controller_file, content):
+            self.error(f"Controller {controller_name} already exists.")
+            return
+
+        self.success(f"Controller {controller_name} created successfully.")
+        self.info(f"File: {controller_file}")
+
+    def _get_basic_controller_stub(self, controller_name: str, is_api: bool = False) -> str:
+        """Get the basic controller stub content"""
+        return _CONTROLLER_STUB.format_map({
+            'controller_name': controller_name,
+            'imports': _API_IMPORTS if is_api else _WEB_BASIC_IMPORTS,
+            'methods': self._get_api_basic_methods() if is_api else self._get_web_basic_methods(),
+        })
+
+    def _get_resource_controller_stub(self, controller_name: str, is_api: bool = False, model_name: Optional[str] = None) -> str:
+        """Get the resource controller stub content"""
+        imports = _API_IMPORTS if is_api else _WEB_RESOURCE_IMPORTS
+        
+        # Add model import if specified
+        if model_name:
+            imports = f"{imports}\nfrom app.Models.{model_name} import {model_name}"
+        
+        if is_api:
+            methods = self._get_api_resource_methods(model_name)
+        else:
+            methods = self._get_web_resource_methods(model_name)
+        
+        return _CONTROLLER_STUB.format_map({
+            'controller_name': controller_name,
+            'imports': imports,
+            'methods': methods,
+        })
+
+    def _get_web_basic_methods(self) -> str:
+        """Get basic web controller methods"""
+        return _WEB_BASIC_METHODS
+
+    def _get_api_basic_methods(self) -> str:
+        """Get basic API controller methods"""
+        return _API_BASIC_METHODS
+
+    def _get_web_resource_methods(self, model_name: Optional[str] = None) -> str:
+        """Get web resource controller methods"""
+        return _resource_methods(False, model_name)
+
+    def _get_api_resource_methods(self, model_name: Optional[str] = None) -> str:
+        """Get API resource controller methods"""
+        return _resource_methods(True, model_name)
\ No newline at end of file
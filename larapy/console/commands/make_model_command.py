@@ -1,9 +1,100 @@
 """Make model console command"""
 
 import os
+from functools import lru_cache
 from typing import Optional
 from ...console.command import Command
 
+# Endings (of the lowercased name) that pluralise with 'es'
+_ES_ENDINGS = frozenset(('s', 'x', 'z', 'ch', 'sh'))
+
+
+@lru_cache(maxsize=256)
+def _table_name(model_name: str) -> str:
+    """Convert a model name to its table name"""
+    # Simple pluralization (add 's' for most cases)
+    # In a more complete implementation, you'd use proper pluralization rules
+    table_name = model_name.lower()
+    
+    # Handle some common irregular plurals
+    if table_name[-1:] == 'y':
+        return table_name[:-1] + 'ies'
+    if table_name[-1:] in _ES_ENDINGS or table_name[-2:] in _ES_ENDINGS:
+        return table_name + 'es'
+    return table_name + 's'
+
+
+# app/Models/<Name>.py template; literal braces are doubled for format_map
+_MODEL_STUB = '''"""{model_name} model"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
+
+from larapy.database.eloquent.model import Model
+from datetime import datetime
+
+
+class {model_name}(Model):
+    """{model_name} model"""
+    
+    # Table name
+    table = '{table_name}'
+    
+    # Primary key
+    primary_key = 'id'
+    
+    # Enable timestamps
+    timestamps = True
+    
+    # Mass assignable attributes
+    fillable = [
+        # Add your fillable fields here
+        # Example: 'name', 'email', 'description'
+    ]
+    
+    # Hidden attributes (for serialization)
+    hidden = [
+        # Add hidden fields here
+        # Example: 'password', 'remember_token'
+    ]
+    
+    # Attribute casting
+    casts = {{
+        # Add attribute casts here
+        # Example: 'is_active': 'boolean', 'settings': 'json'
+    }}
+    
+    # Date attributes
+    dates = [
+        # Add date fields here
+        # Example: 'published_at', 'deleted_at'
+    ]
+    
+    def __init__(self, attributes=None):
+        super().__init__(attributes)
+    
+    # Define your relationships here
+    # Example:
+    # def user(self):
+    #     \"\"\"Belongs to a user\"\"\"
+    #     return self.belongs_to('User', 'user_id', 'id')
+    
+    # def posts(self):
+    #     \"\"\"Has many posts\"\"\"
+    #     return self.has_many('Post', '{model_name_lower}_id', 'id')
+    
+    # Define your model methods here
+    # Example:
+    # def is_active(self) -> bool:
+    #     \"\"\"Check if the {model_name_lower} is active\"\"\"
+    #     return self.get_attribute('is_active', False)
+    
+    # def get_full_name(self) -> str:
+    #     \"\"\"Get the full name\"\"\"
+    #     return f"{{self.first_name}} {{self.last_name}}"
+'''
+
 
 class MakeModelCommand(Command):
     """Create a new Eloquent model"""
@@ -64,24 +155,18 @@ class MakeModelCommand(Command):
 
     def _create_model_file(self, model_name: str):
         """Create the model file"""
-        # Create Models directory if it doesn't exist
         models_dir = "app/Models"
-        os.makedirs(models_dir, exist_ok=True)
 
         # Create model file path
         model_file = os.path.join(models_dir, f"{model_name}.py")
 
-        # Check if file already exists
-        if os.path.exists(model_file):
-            self.error(f"Model {model_name} already exists.")
-            return
-
         # Generate model content
         content = self._get_model_stub(model_name)
 
-        # Write model file
-        with open(model_file, 'w') as f:
-            f.write(content)
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(model_file, content):
+            self.error(f"Model {model_name} already exists.")
+            return
 
         self.success(f"Model {model_name} created successfully.")
         self.info(f"File: {model_file}")
@@ -90,91 +175,15 @@ class MakeModelCommand(Command):
         """Get the model stub content"""
         table_name = self._get_table_name(model_name)
         
-        return f'''"""{model_name} model"""
-
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'package-larapy'))
-
-from larapy.database.eloquent.model import Model
-from datetime import datetime
-
-
-class {model_name}(Model):
-    """{model_name} model"""
-    
-    # Table name
-    table = '{table_name}'
-    
-    # Primary key
-    primary_key = 'id'
-    
-    # Enable timestamps
-    timestamps = True
-    
-    # Mass assignable attributes
-    fillable = [
-        # Add your fillable fields here
-        # Example: 'name', 'email', 'description'
-    ]
-    
-    # Hidden attributes (for serialization)
-    hidden = [
-        # Add hidden fields here
-        # Example: 'password', 'remember_token'
-    ]
-    
-    # Attribute casting
-    casts = {{
-        # Add attribute casts here
-        # Example: 'is_active': 'boolean', 'settings': 'json'
-    }}
-    
-    # Date attributes
-    dates = [
-        # Add date fields here
-        # Example: 'published_at', 'deleted_at'
-    ]
-    
-    def __init__(self, attributes=None):
-        super().__init__(attributes)
-    
-    # Define your relationships here
-    # Example:
-    # def user(self):
-    #     \"\"\"Belongs to a user\"\"\"
-    #     return self.belongs_to('User', 'user_id', 'id')
-    
-    # def posts(self):
-    #     \"\"\"Has many posts\"\"\"
-    #     return self.has_many('Post', '{model_name.lower()}_id', 'id')
-    
-    # Define your model methods here
-    # Example:
-    # def is_active(self) -> bool:
-    #     \"\"\"Check if the {model_name.lower()} is active\"\"\"
-    #     return self.get_attribute('is_active', False)
-    
-    # def get_full_name(self) -> str:
-    #     \"\"\"Get the full name\"\"\"
-    #     return f"{{self.first_name}} {{self.last_name}}"
-'''
+        return _MODEL_STUB.format_map({
+            'model_name': model_name,
+            'model_name_lower': model_name.lower(),
+            'table_name': table_name,
+        })
 
     def _get_table_name(self, model_name: str) -> str:
         """Convert model name to table name (plural, snake_case)"""
-        # Simple pluralization (add 's' for most cases)
-        # In a more complete implementation, you'd use proper pluralization rules
-        table_name = model_name.lower()
-        
-        # Handle some common irregular plurals
-        if table_name.endswith('y'):
-            table_name = table_name[:-1] + 'ies'
-        elif table_name.endswith(('s', 'x', 'z', 'ch', 'sh')):
-            table_name = table_name + 'es'
-        else:
-            table_name = table_name + 's'
-        
-        return table_name
+        return _table_name(model_name)
 
     def _create_migration(self, model_name: str):
         """Create migration for the model"""
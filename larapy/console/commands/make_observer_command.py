@@ -56,7 +56,7 @@ class MakeObserverCommand(Command):
         # Split CamelCase and capitalize each word properly
         import re
         words = re.findall(r'[A-Z][a-z]*|[a-z]+', name[:-8] if name.endswith('Observer') else name)
-        cleaned_name = ''.join(word.capitalize() for word in words)
+        cleaned_name = ''.join([word.capitalize() for word in words])
         
         return cleaned_name + 'Observer'
 
@@ -64,28 +64,22 @@ class MakeObserverCommand(Command):
         """Clean and format model name"""
         import re
         words = re.findall(r'[A-Z][a-z]*|[a-z]+', name)
-        return ''.join(word.capitalize() for word in words)
+        return ''.join([word.capitalize() for word in words])
 
     def _create_observer_file(self, observer_name: str, model_name: Optional[str]):
         """Create the observer file"""
-        # Create observers directory if it doesn't exist
         observers_dir = "app/Observers"
-        os.makedirs(observers_dir, exist_ok=True)
 
         # Create observer file path
         observer_file = os.path.join(observers_dir, f"{observer_name}.py")
 
-        # Check if file already exists
-        if os.path.exists(observer_file):
-            self.error(f"Observer {observer_name} already exists.")
-            return
-
         # Generate observer content
         content = self._get_observer_stub(observer_name, model_name)
 
-        # Write observer file
-        with open(observer_file, 'w') as f:
-            f.write(content)
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(observer_file, content):
+            self.error(f"Observer {observer_name} already exists.")
+            return
 
         self.success(f"Observer {observer_name} created successfully.")
         self.info(f"File: {observer_file}")
@@ -45,28 +45,22 @@ class MakeProviderCommand(Command):
         
         # Ensure proper capitalization (capitalize each word)
         base_name = name.replace('ServiceProvider', '').replace('Provider', '')
-        return ''.join(word.capitalize() for word in base_name.split()) + 'ServiceProvider'
+        return ''.join([word.capitalize() for word in base_name.split()]) + 'ServiceProvider'
 
     def _create_provider_file(self, provider_name: str):
         """Create the provider file"""
-        # Create Providers directory if it doesn't exist
         providers_dir = "app/Providers"
-        os.makedirs(providers_dir, exist_ok=True)
 
         # Create provider file path
         provider_file = os.path.join(providers_dir, f"{provider_name}.py")
 
-        # Check if file already exists
-        if os.path.exists(provider_file):
-            self.error(f"Service provider {provider_name} already exists.")
-            return
-
         # Generate provider content
         content = self._get_provider_stub(provider_name)
 
-        # Write provider file
-        with open(provider_file, 'w') as f:
-            f.write(content)
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(provider_file, content):
+            self.error(f"Service provider {provider_name} already exists.")
+            return
 
         self.success(f"Service provider {provider_name} created successfully.")
         self.info(f"File: {provider_file}")
@@ -47,28 +47,22 @@ class MakeRequestCommand(Command):
         words = re.findall(r'[A-Z][a-z]*|[a-z]+', name)
         
         # Capitalize each word and join them
-        return ''.join(word.capitalize() for word in words)
+        return ''.join([word.capitalize() for word in words])
 
     def _create_request_file(self, request_name: str):
         """Create the request file"""
-        # Create Requests directory if it doesn't exist
         requests_dir = "app/Http/Requests"
-        os.makedirs(requests_dir, exist_ok=True)
 
         # Create request file path
         request_file = os.path.join(requests_dir, f"{request_name}.py")
 
-        # Check if file already exists
-        if os.path.exists(request_file):
-            self.error(f"Request {request_name} already exists.")
-            return
-
         # Generate request content
         content = self._get_request_stub(request_name)
 
-        # Write request file
-        with open(request_file, 'w') as f:
-            f.write(content)
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(request_file, content):
+            self.error(f"Request {request_name} already exists.")
+            return
 
         self.success(f"Request {request_name} created successfully.")
         self.info(f"File: {request_file}")
@@ -44,30 +44,24 @@ class MakeRuleCommand(Command):
         # Split CamelCase and capitalize each word properly
         import re
         words = re.findall(r'[A-Z][a-z]*|[a-z]+', name[:-4] if name.endswith('Rule') else name)
-        cleaned_name = ''.join(word.capitalize() for word in words)
+        cleaned_name = ''.join([word.capitalize() for word in words])
         
         return cleaned_name + 'Rule'
 
     def _create_rule_file(self, rule_name: str):
         """Create the rule file"""
-        # Create rules directory if it doesn't exist
         rules_dir = "app/Rules"
-        os.makedirs(rules_dir, exist_ok=True)
 
         # Create rule file path
         rule_file = os.path.join(rules_dir, f"{rule_name}.py")
 
-        # Check if file already exists
-        if os.path.exists(rule_file):
-            self.error(f"Rule {rule_name} already exists.")
-            return
-
         # Generate rule content
         content = self._get_rule_stub(rule_name)
 
-        # Write rule file
-        with open(rule_file, 'w') as f:
-            f.write(content)
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(rule_file, content):
+            self.error(f"Rule {rule_name} already exists.")
+            return
 
         self.success(f"Rule {rule_name} created successfully.")
         self.info(f"File: {rule_file}")
@@ -52,7 +52,7 @@ class MakeTestCommand(Command):
             # PascalCase for unittest style - fix capitalization
             import re
             words = re.findall(r'[A-Z][a-z]*|[a-z]+', name)
-            return ''.join(word.capitalize() for word in words)
+            return ''.join([word.capitalize() for word in words])
 
     def _determine_test_type(self) -> str:
         """Determine the type of test to create"""
@@ -69,22 +69,25 @@ class MakeTestCommand(Command):
             for i, test_type in enumerate(test_types, 1):
                 print(f"{i}. {test_type.capitalize()} Test")
             
+            # Accept either the menu number or the type name
+            choices = {str(i): test_type for i, test_type in enumerate(test_types, 1)}
+            choices.update((test_type, test_type) for test_type in test_types)
+            
             while True:
                 try:
                     choice = input("\\nEnter your choice (1-3): ").strip()
-                    if choice in ['1', '2', '3']:
-                        return test_types[int(choice) - 1]
-                    else:
-                        print("Please enter 1, 2, or 3.")
-                except (ValueError, KeyboardInterrupt):
+                    test_type = choices.get(choice)
+                    if test_type is not None:
+                        return test_type
+                    print("Please enter 1, 2, or 3.")
+                except KeyboardInterrupt:
                     print("\\nDefaulting to unit test.")
                     return 'unit'
 
     def _create_test_file(self, test_name: str, test_type: str):
         """Create the test file"""
-        # Create test directory based on type
+        # Test directory based on type
         test_dir = f"tests/{test_type}"
-        os.makedirs(test_dir, exist_ok=True)
 
         # Create test file path
         if test_name.startswith('test_'):
@@ -94,17 +97,13 @@ class MakeTestCommand(Command):
             # unittest style
             test_file = os.path.join(test_dir, f"{test_name}.py")
 
-        # Check if file already exists
-        if os.path.exists(test_file):
-            self.error(f"Test {test_name} already exists.")
-            return
-
         # Generate test content
         content = self._get_test_stub(test_name, test_type)
 
-        # Write test file
-        with open(test_file, 'w') as f:
-            f.write(content)
+        # Write the file; it is created atomically and never overwritten
+        if not self._write_new_file(test_file, content):
+            self.error(f"Test {test_name} already exists.")
+            return
 
         self.success(f"{test_type.capitalize()} test {test_name} created successfully.")
         self.info(f"File: {test_file}")
@@ -123,7 +122,7 @@ class MakeTestCommand(Command):
 
     def _get_unit_test_stub(self, test_name: str) -> str:
         """Get unit test stub content"""
-        class_name = test_name if not test_name.startswith('test_') else ''.join(word.capitalize() for word in test_name.split('_'))
+        class_name = test_name if not test_name.startswith('test_') else ''.join([word.capitalize() for word in test_name.split('_')])
         
         return f'''"""
 {test_name}
@@ -213,7 +212,7 @@ if __name__ == '__main__':
 
     def _get_feature_test_stub(self, test_name: str) -> str:
         """Get feature test stub content"""
-        class_name = test_name if not test_name.startswith('test_') else ''.join(word.capitalize() for word in test_name.split('_'))
+        class_name = test_name if not test_name.startswith('test_') else ''.join([word.capitalize() for word in test_name.split('_')])
         
         return f'''"""
 {test_name}
@@ -336,7 +335,7 @@ if __name__ == '__main__':
 
     def _get_integration_test_stub(self, test_name: str) -> str:
         """Get integration test stub content"""
-        class_name = test_name if not test_name.startswith('test_') else ''.join(word.capitalize() for word in test_name.split('_'))
+        class_name = test_name if not test_name.startswith('test_') else ''.join([word.capitalize() for word in test_name.split('_')])
         
         return f'''"""
 {test_name}
@@ -1,6 +1,7 @@
 """Route list console command"""
 
 import os
+import sys
 from typing import Optional
 from ...console.command import Command
 
@@ -99,41 +100,29 @@ class RouteListCommand(Command):
 
     def _display_routes(self, routes):
         """Display routes in a formatted table"""
-        # Calculate column widths
-        method_width = max(len(str(route['methods'])) for route in routes)
-        method_width = max(method_width, len('Method'))
+        headers = ('Method', 'URI', 'Name', 'Action')
+        rows = [
+            ("|".join(route['methods']) if route['methods'] else 'ANY',
+             route['uri'], route['name'], route['action'])
+            for route in routes
+        ]
         
-        uri_width = max(len(route['uri']) for route in routes)
-        uri_width = max(uri_width, len('URI'))
-        
-        name_width = max(len(route['name']) for route in routes)
-        name_width = max(name_width, len('Name'))
-        
-        action_width = max(len(route['action']) for route in routes)
-        action_width = max(action_width, len('Action'))
-        
-        # Add some padding
-        method_width += 2
-        uri_width += 2
-        name_width += 2
-        action_width += 2
+        # Column widths from the widest cell (header included), plus some padding
+        widths = [max(map(len, column)) + 2 for column in zip(headers, *rows)]
         
         # Print header
         self.line("")
         self.info("Route List:")
         self.line("")
         
-        header = f"{'Method':<{method_width}} {'URI':<{uri_width}} {'Name':<{name_width}} {'Action':<{action_width}}"
-        self.line(header)
-        self.line("-" * len(header))
+        header = " ".join(cell.ljust(width) for cell, width in zip(headers, widths))
+        out = [header, "-" * len(header)]
         
-        # Print routes
-        for route in routes:
-            methods_str = "|".join(route['methods']) if route['methods'] else 'ANY'
-            line = f"{methods_str:<{method_width}} {route['uri']:<{uri_width}} {route['name']:<{name_width}} {route['action']:<{action_width}}"
-            self.line(line)
+        # Build every route row, then write the table in one call
+        out.extend(" ".join(cell.ljust(width) for cell, width in zip(row, widths)) for row in rows)
         
-        self.line("")
+        out.append("")
+        sys.stdout.write("\n".join(out) + "\n")
         self.success(f"Showing {len(routes)} routes")
 
     def _format_methods(self, methods):
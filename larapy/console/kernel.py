@@ -1,9 +1,73 @@
 """Console Kernel for handling console commands"""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, NamedTuple, Optional
+import bisect
+import difflib
+import importlib
 import sys
 import os
 
+from .command import Command, _command_name_from_signature
+
+
+# Built-in command name -> "module:Class", imported relative to this package on first use
+_DEFAULT_COMMANDS = {
+    # These commands work without database connections
+    'make:migration': '..database.console.make_migration_command:MakeMigrationCommand',
+    'make:factory': '..database.console.make_factory_command:MakeFactoryCommand',
+    'make:seeder': '..database.console.make_seeder_command:MakeSeederCommand',
+    
+    # Phase 1 commands
+    'make:model': '.commands.make_model_command:MakeModelCommand',
+    'make:controller': '.commands.make_controller_command:MakeControllerCommand',
+    'make:middleware': '.commands.make_middleware_command:MakeMiddlewareCommand',
+    'make:provider': '.commands.make_provider_command:MakeProviderCommand',
+    'serve': '.commands.serve_command:ServeCommand',
+    
+    # Phase 2 commands
+    'route:list': '.commands.route_list_command:RouteListCommand',
+    'make:request': '.commands.make_request_command:MakeRequestCommand',
+    'make:command': '.commands.make_command_command:MakeCommandCommand',
+    'make:test': '.commands.make_test_command:MakeTestCommand',
+    'config:show': '.commands.config_show_command:ConfigShowCommand',
+    
+    # Phase 3 commands
+    'make:rule': '.commands.make_rule_command:MakeRuleCommand',
+    'make:observer': '.commands.make_observer_command:MakeObserverCommand',
+    
+    # Migration commands
+    'migrate': '..database.console.migrate_command:MigrateCommand',
+    'migrate:refresh': '..database.console.migrate_refresh_command:MigrateRefreshCommand',
+    'migrate:reset': '..database.console.migrate_reset_command:MigrateResetCommand',
+    'migrate:rollback': '..database.console.rollback_command:RollbackCommand',
+    'migrate:fresh': '..database.console.fresh_command:FreshCommand',
+    
+    # Database seeding commands
+    'db:seed': '..database.console.seed_command:SeedCommand',
+    'db:reset': '..database.console.reset_command:ResetCommand',
+}
+
+
+# "module:Class" path -> imported class, shared by every kernel in the process
+_CLASS_CACHE: Dict[str, type] = {}
+
+
+def _import_class(path: str) -> type:
+    """Import a "module:Class" path relative to this package, caching the result"""
+    cls = _CLASS_CACHE.get(path)
+    if cls is None:
+        module_path, _, class_name = path.partition(':')
+        module = importlib.import_module(module_path, __package__)
+        cls = _CLASS_CACHE[path] = getattr(module, class_name)
+    return cls
+
+
+class CommandMeta(NamedTuple):
+    """Static details of a registered command used by help listings"""
+    name: str
+    description: str
+    signature: str
+
 
 class ConsoleKernel:
     """
@@ -13,125 +77,29 @@ class ConsoleKernel:
     def __init__(self, app=None):
         self.app = app
         self.commands = {}
+        # Command names kept sorted, overall and per help category
+        self._sorted_names: List[str] = []
+        self._categories: Dict[str, List[str]] = {
+            'make': [],
+            'migrate': [],
+            'db': [],
+            'app': [],
+            'other': []
+        }
+        # Command name -> metadata for help listings, built without running commands
+        self._meta: Dict[str, CommandMeta] = {}
         self.register_default_commands()
         self.register_application_commands()
 
     def register_default_commands(self):
         """Register default framework commands"""
-        # Register commands that don't need complex dependencies first
-        try:
-            from ..database.console.make_migration_command import MakeMigrationCommand
-            from ..database.console.make_factory_command import MakeFactoryCommand
-            from ..database.console.make_seeder_command import MakeSeederCommand
-            
-            # These commands work without database connections
-            self.register_command('make:migration', lambda: MakeMigrationCommand())
-            self.register_command('make:factory', lambda: MakeFactoryCommand())
-            self.register_command('make:seeder', lambda: MakeSeederCommand())
-            
-        except ImportError as e:
-            print(f"Warning: Could not register make commands: {e}")
-        
-        # Register general make commands
-        try:
-            from .commands.make_model_command import MakeModelCommand
-            from .commands.make_controller_command import MakeControllerCommand
-            from .commands.make_middleware_command import MakeMiddlewareCommand
-            from .commands.make_provider_command import MakeProviderCommand
-            from .commands.serve_command import ServeCommand
-            from .commands.route_list_command import RouteListCommand
-            from .commands.make_request_command import MakeRequestCommand
-            from .commands.make_command_command import MakeCommandCommand
-            from .commands.make_test_command import MakeTestCommand
-            from .commands.config_show_command import ConfigShowCommand
-            from .commands.make_rule_command import MakeRuleCommand
-            from .commands.make_observer_command import MakeObserverCommand
-            
-            # Phase 1 commands
-            self.register_command('make:model', lambda: MakeModelCommand())
-            self.register_command('make:controller', lambda: MakeControllerCommand())
-            self.register_command('make:middleware', lambda: MakeMiddlewareCommand())
-            self.register_command('make:provider', lambda: MakeProviderCommand())
-            self.register_command('serve', lambda: ServeCommand())
-            
-            # Phase 2 commands
-            self.register_command('route:list', lambda: RouteListCommand())
-            self.register_command('make:request', lambda: MakeRequestCommand())
-            self.register_command('make:command', lambda: MakeCommandCommand())
-            self.register_command('make:test', lambda: MakeTestCommand())
-            self.register_command('config:show', lambda: ConfigShowCommand())
-            
-            # Phase 3 commands
-            self.register_command('make:rule', lambda: MakeRuleCommand())
-            self.register_command('make:observer', lambda: MakeObserverCommand())
-            
-        except ImportError as e:
-            print(f"Warning: Could not register general commands: {e}")
-        
-        # Register all available database commands
-        try:
-            self._register_all_database_commands()
-        except Exception as e:
-            print(f"Warning: Database commands not available: {e}")
-
-    def _register_all_database_commands(self):
-        """Register all available database commands"""
-        # Migration commands
-        try:
-            from ..database.console.migrate_command import MigrateCommand
-            self.register_command('migrate', lambda: MigrateCommand())
-        except Exception as e:
-            print(f"Warning: migrate command not available: {e}")
-        
-        try:
-            from ..database.console.migrate_status_command import MigrateStatusCommand
-            self.register_command('migrate:status', self._create_status_command)
-        except Exception as e:
-            print(f"Warning: migrate:status command not available: {e}")
-        
-        try:
-            from ..database.console.migrate_install_command import MigrateInstallCommand
-            self.register_command('migrate:install', self._create_install_command)
-        except Exception as e:
-            print(f"Warning: migrate:install command not available: {e}")
-        
-        try:
-            from ..database.console.migrate_refresh_command import MigrateRefreshCommand
-            self.register_command('migrate:refresh', lambda: MigrateRefreshCommand())
-        except Exception as e:
-            print(f"Warning: migrate:refresh command not available: {e}")
+        # Registered by import path; each module is imported when its command is first used
+        for name, path in _DEFAULT_COMMANDS.items():
+            self.register_command(name, path)
         
-        try:
-            from ..database.console.migrate_reset_command import MigrateResetCommand
-            self.register_command('migrate:reset', lambda: MigrateResetCommand())
-        except Exception as e:
-            print(f"Warning: migrate:reset command not available: {e}")
-        
-        try:
-            from ..database.console.rollback_command import RollbackCommand
-            self.register_command('migrate:rollback', lambda: RollbackCommand())
-        except Exception as e:
-            print(f"Warning: migrate:rollback command not available: {e}")
-        
-        try:
-            from ..database.console.fresh_command import FreshCommand
-            self.register_command('migrate:fresh', lambda: FreshCommand())
-        except Exception as e:
-            print(f"Warning: migrate:fresh command not available: {e}")
-        
-        # Database seeding commands
-        try:
-            from ..database.console.seed_command import SeedCommand
-            self.register_command('db:seed', lambda: SeedCommand())
-        except Exception as e:
-            print(f"Warning: db:seed command not available: {e}")
-        
-        # Additional database commands
-        try:
-            from ..database.console.reset_command import ResetCommand
-            self.register_command('db:reset', lambda: ResetCommand())
-        except Exception as e:
-            print(f"Warning: db:reset command not available: {e}")
+        # These need a migration repository, so they are built by factories
+        self.register_command('migrate:status', self._create_status_command)
+        self.register_command('migrate:install', self._create_install_command)
         
     def _create_status_command(self):
         """Create migrate:status command with error handling"""
@@ -183,7 +151,33 @@ class ConsoleKernel:
 
     def register_command(self, name: str, command_class):
         """Register a console command"""
+        if name not in self.commands:
+            bisect.insort(self._sorted_names, name)
+            bisect.insort(self._categories[self._command_category(name)], name)
         self.commands[name] = command_class
+        self._meta.pop(name, None)
+        if isinstance(command_class, type) and getattr(command_class, 'description', ''):
+            self._meta[name] = self._meta_from(name, command_class)
+
+    def _resolve_command(self, name: str):
+        """Get a command's factory, importing it first if it was registered by path"""
+        command_factory = self.commands.get(name)
+        if isinstance(command_factory, str):
+            command_factory = self.commands[name] = _import_class(command_factory)
+        return command_factory
+
+    @staticmethod
+    def _command_category(name: str) -> str:
+        """Get the help category a command is listed under"""
+        if name.startswith('make:'):
+            return 'make'
+        if name.startswith('migrate'):
+            return 'migrate'
+        if name.startswith('db:'):
+            return 'db'
+        if name.startswith('app:'):
+            return 'app'
+        return 'other'
 
     def handle(self, args: List[str]) -> int:
         """Handle console command execution"""
@@ -202,27 +196,27 @@ class ConsoleKernel:
             self.show_version()
             return 0
         
-        if command_name not in self.commands:
+        command_factory = self.commands.get(command_name)
+        if command_factory is None:
             # Check for prefix matches
             prefix_matches = self.find_prefix_matches(command_name)
             if prefix_matches:
                 self.show_prefix_matches(command_name, prefix_matches)
                 return 1
+            
+            out = [f"Command '{command_name}' not found."]
+            similar_commands = self.find_similar_commands(command_name)
+            if similar_commands:
+                out.append("\nDid you mean one of these?")
+                out.extend(f"  {similar}" for similar in similar_commands)
             else:
-                print(f"Command '{command_name}' not found.")
-                self.show_available_commands()
-                return 1
+                out.extend(self._available_command_lines())
+            self._write(out)
+            return 1
         
         try:
-            command_factory = self.commands[command_name]
-            
-            # If it's a callable (lambda), call it to get the instance
-            if callable(command_factory) and not hasattr(command_factory, 'handle'):
-                command = command_factory()
-            else:
-                # It's a class, instantiate it
-                command = command_factory()
-                
+            # Command classes and factory callables are both invoked to get the instance
+            command = self._resolve_command(command_name)()
             return command.run(command_args)
         except Exception as e:
             print(f"Error executing command '{command_name}': {e}")
@@ -230,52 +224,82 @@ class ConsoleKernel:
 
     def find_prefix_matches(self, prefix: str) -> List[str]:
         """Find commands that start with the given prefix"""
-        matches = []
         prefix_with_colon = prefix + ':'
+        names = self._sorted_names
         
-        for command_name in self.commands.keys():
-            if command_name.startswith(prefix_with_colon):
-                matches.append(command_name)
+        # Matches form a contiguous run in the sorted names
+        matches = []
+        for command_name in names[bisect.bisect_left(names, prefix_with_colon):]:
+            if not command_name.startswith(prefix_with_colon):
+                break
+            matches.append(command_name)
         
-        return sorted(matches)
+        return matches
+
+    def find_similar_commands(self, name: str) -> List[str]:
+        """Find registered commands whose names closely resemble a mistyped one"""
+        return difflib.get_close_matches(name, self.commands.keys(), n=5, cutoff=0.6)
+
+    def get_command_meta(self, name: str) -> CommandMeta:
+        """Get a command's metadata, instantiating it only when the class doesn't declare a description"""
+        meta = self._meta.get(name)
+        if meta is None:
+            command_factory = self._resolve_command(name)
+            if isinstance(command_factory, type) and getattr(command_factory, 'description', ''):
+                source = command_factory
+            else:
+                source = command_factory()
+            meta = self._meta[name] = self._meta_from(name, source)
+        return meta
+
+    @staticmethod
+    def _meta_from(name: str, source) -> CommandMeta:
+        """Build command metadata from a command class or instance"""
+        return CommandMeta(
+            name,
+            getattr(source, 'description', '') or 'No description available',
+            getattr(source, 'signature', '') or name,
+        )
+
+    def get_command_description(self, name: str) -> str:
+        """Get a command's description"""
+        return self.get_command_meta(name).description
 
     def show_prefix_matches(self, prefix: str, matches: List[str]):
         """Show available commands for a given prefix"""
-        print(f"Command '{prefix}' not found.")
-        print(f"\n✨ Did you mean one of these commands with '{prefix}:' prefix?")
-        print("=" * 70)
+        out = [
+            f"Command '{prefix}' not found.",
+            f"\n✨ Did you mean one of these commands with '{prefix}:' prefix?",
+            "=" * 70,
+        ]
         
         for command_name in matches:
             try:
-                # Get command description
-                command_factory = self.commands[command_name]
-                if callable(command_factory) and not hasattr(command_factory, 'handle'):
-                    command = command_factory()
-                else:
-                    command = command_factory()
-                
-                description = getattr(command, 'description', 'No description available')
-                print(f"  📝 {command_name:<20} {description}")
-                
+                description = self.get_command_description(command_name)
             except Exception:
-                print(f"  📝 {command_name:<20} Available command")
+                description = "Available command"
+            out.append("  📝 " + command_name.ljust(20) + " " + description)
         
-        print(f"\n💡 Usage:")
-        print(f"   larapy <command> [arguments] [options]")
-        print(f"\n🚀 Example:")
+        out.append(f"\n💡 Usage:")
+        out.append(f"   larapy <command> [arguments] [options]")
+        out.append(f"\n🚀 Example:")
         if matches:
-            print(f"   larapy {matches[0]}")
+            out.append(f"   larapy {matches[0]}")
         
-        print(f"\n💭 Tip: Use 'larapy --help' to see all available commands.")
+        out.append(f"\n💭 Tip: Use 'larapy --help' to see all available commands.")
+        self._write(out)
 
     def show_help(self):
         """Show help information"""
-        print("Larapy Console Application")
-        print("")
-        print("Usage:")
-        print("  larapy <command> [arguments] [options]")
-        print("")
-        self.show_available_commands()
+        out = [
+            "Larapy Console Application",
+            "",
+            "Usage:",
+            "  larapy <command> [arguments] [options]",
+            "",
+        ]
+        out.extend(self._available_command_lines())
+        self._write(out)
 
     def show_version(self):
         """Show version information"""
@@ -283,35 +307,24 @@ class ConsoleKernel:
 
     def show_available_commands(self):
         """Show available commands"""
-        print("Available commands:")
-        
-        # Group commands by category
-        categories = {
-            'make': [],
-            'migrate': [],
-            'db': [],
-            'app': [],
-            'other': []
-        }
-        
-        for command_name in sorted(self.commands.keys()):
-            if command_name.startswith('make:'):
-                categories['make'].append(command_name)
-            elif command_name.startswith('migrate'):
-                categories['migrate'].append(command_name)
-            elif command_name.startswith('db:'):
-                categories['db'].append(command_name)
-            elif command_name.startswith('app:'):
-                categories['app'].append(command_name)
-            else:
-                categories['other'].append(command_name)
+        self._write(self._available_command_lines())
+
+    def _available_command_lines(self) -> List[str]:
+        """Build the lines of the available commands listing"""
+        out = ["Available commands:"]
         
         # Display categories
-        for category, commands in categories.items():
+        for category, commands in self._categories.items():
             if commands:
-                print(f"\n {category}:")
-                for cmd in commands:
-                    print(f"  {cmd}")
+                out.append(f"\n {category}:")
+                out.extend(f"  {cmd}" for cmd in commands)
+        
+        return out
+
+    @staticmethod
+    def _write(lines: List[str]):
+        """Write lines to stdout in a single call"""
+        sys.stdout.write('\n'.join(lines) + '\n')
 
     def call(self, command: str, parameters: Dict[str, Any] = None) -> int:
         """Programmatically call a command"""
@@ -348,7 +361,7 @@ class ConsoleKernel:
                     try:
                         # Import the module
                         module_name = f"app.console.commands.{file_name[:-3]}"
-                        module = __import__(module_name, fromlist=[''])
+                        module = importlib.import_module(module_name)
                         
                         # Find command classes in the module
                         for attr_name in dir(module):
@@ -361,21 +374,18 @@ class ConsoleKernel:
                                 attr_name != 'Command'):
                                 
                                 try:
-                                    # Create an instance to get the command name
-                                    instance = attr()
-                                    
-                                    # Get command name from signature or get_name method
-                                    if hasattr(instance, 'get_name'):
-                                        command_name = instance.get_name()
-                                    elif hasattr(instance, 'signature'):
-                                        # Extract command name from signature
-                                        signature = instance.signature
-                                        command_name = signature.split()[0] if signature else attr_name.lower()
+                                    # Read the command name off the class; only commands that
+                                    # compute it in get_name() need to be instantiated
+                                    if isinstance(getattr(attr, 'name', None), str) and attr.name:
+                                        command_name = attr.name
+                                    elif getattr(attr, 'get_name', Command.get_name) is not Command.get_name:
+                                        command_name = attr().get_name()
                                     else:
-                                        command_name = attr_name.lower()
+                                        # Extract command name from signature
+                                        command_name = _command_name_from_signature(attr.signature) or attr_name.lower()
                                     
                                     # Register the command
-                                    self.register_command(command_name, lambda cls=attr: cls())
+                                    self.register_command(command_name, attr)
                                     
                                 except Exception as e:
                                     print(f"Warning: Could not register command {attr_name}: {e}")
@@ -2,10 +2,28 @@
 Laravel-style ORM Implementation for Larapy
 """
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Type, Union
+from typing import Any, Dict, Iterator, List, Optional, Type, Union
 import sqlite3
 import json
 from datetime import datetime
+from flask import g, has_request_context
+
+
+def _row_cache() -> Optional[Dict]:
+    """Get the request-scoped (table, primary key) -> row cache, or None outside a request"""
+    if not has_request_context():
+        return None
+    if '_model_row_cache' not in g:
+        g._model_row_cache = {}
+    return g._model_row_cache
+
+
+def _forget_rows(table: str):
+    """Drop a table's rows from the request-scoped row cache after a write"""
+    cache = g.get('_model_row_cache') if has_request_context() else None
+    if cache:
+        for key in [key for key in cache if key[0] == table]:
+            del cache[key]
 
 
 class DatabaseConnection:
@@ -180,6 +198,12 @@ class QueryBuilder:
         query, params = self._build_query()
         return self.connection.fetch_all(query, params)
     
+    def cursor(self) -> Iterator[Dict]:
+        """Execute the query and lazily yield each row as a dict"""
+        query, params = self._build_query()
+        for row in self.connection.execute(query, params):
+            yield dict(row)
+    
     def first(self) -> Optional[Dict]:
         """Get the first result"""
         query, params = self._build_query()
@@ -194,6 +218,15 @@ class QueryBuilder:
         self._select = original_select
         return result['count'] if result else 0
     
+    def exists(self) -> bool:
+        """Determine if any rows match the query without counting them"""
+        original_select, original_limit = self._select, self._limit
+        self._select = ['1']
+        self._limit = 1
+        query, params = self._build_query()
+        self._select, self._limit = original_select, original_limit
+        return self.connection.execute(query, params).fetchone() is not None
+    
     def insert(self, data: Dict[str, Any]) -> int:
         """Insert a new record"""
         columns = list(data.keys())
@@ -205,6 +238,21 @@ class QueryBuilder:
         self.connection.commit()
         return cursor.lastrowid
     
+    def insert_many(self, columns: List[str], rows: List[tuple]) -> int:
+        """Insert many records with a single executemany call"""
+        if not rows:
+            return 0
+        
+        placeholders = ','.join(['?' for _ in columns])
+        query = f"INSERT INTO {self.table} ({','.join(columns)}) VALUES ({placeholders})"
+        try:
+            cursor = self.connection.connection.executemany(query, rows)
+            self.connection.commit()
+        except Exception:
+            self.connection.rollback()
+            raise
+        return cursor.rowcount
+    
     def update(self, data: Dict[str, Any]) -> int:
         """Update records"""
         set_clauses = []
@@ -231,6 +279,7 @@ class QueryBuilder:
         
         cursor = self.connection.execute(query, tuple(params))
         self.connection.commit()
+        _forget_rows(self.table)
         return cursor.rowcount
     
     def delete(self) -> int:
@@ -253,6 +302,7 @@ class QueryBuilder:
         
         cursor = self.connection.execute(query, tuple(params))
         self.connection.commit()
+        _forget_rows(self.table)
         return cursor.rowcount
 
 
@@ -278,7 +328,7 @@ class Model(metaclass=ModelMeta):
     created_at = 'created_at'
     updated_at = 'updated_at'
     
-    _connection = None
+    _conn_cache = None
     
     def __init__(self, **attributes):
         self.attributes = {}
@@ -291,15 +341,28 @@ class Model(metaclass=ModelMeta):
     
     @classmethod
     def set_connection(cls, connection: DatabaseConnection):
-        """Set the database connection"""
-        cls._connection = connection
+        """Set the database connection explicitly, overriding the container default"""
+        cls._conn_cache = connection
+    
+    @classmethod
+    def _connection(cls) -> DatabaseConnection:
+        """Get the model's connection, resolving it from the container on first use"""
+        return cls._conn_cache or cls._resolve_conn()
+    
+    @classmethod
+    def _resolve_conn(cls) -> DatabaseConnection:
+        """Resolve the default connection from the application's 'db' binding and memoize it"""
+        from ..support.facades.facade import Facade
+        
+        if Facade._app is None:
+            raise RuntimeError("No database connection set")
+        cls._conn_cache = Facade._app.resolve('db').connection()
+        return cls._conn_cache
     
     @classmethod
     def query(cls) -> QueryBuilder:
         """Get a query builder instance"""
-        if not cls._connection:
-            raise RuntimeError("No database connection set")
-        return QueryBuilder(cls._connection, cls.table)
+        return QueryBuilder(cls._connection(), cls.table)
     
     @classmethod
     def all(cls) -> List['Model']:
@@ -309,10 +372,51 @@ class Model(metaclass=ModelMeta):
     
     @classmethod
     def find(cls, id: Any) -> Optional['Model']:
-        """Find a record by primary key"""
+        """Find a record by primary key
+        
+        Within a request, fetched rows are cached on ``flask.g`` so repeated
+        lookups of the same key do not hit the database again. Every lookup
+        still returns a fresh instance, and updates or deletes through the
+        query builder drop the table's cached rows.
+        """
+        cache = _row_cache()
+        key = (cls.table, str(id))
+        if cache is not None and key in cache:
+            return cls._hydrate(cache[key])
+        
         result = cls.query().where(cls.primary_key, id).first()
+        if cache is not None and result:
+            cache[key] = result
         return cls._hydrate(result) if result else None
     
+    @classmethod
+    def find_many(cls, ids: List[Any]) -> List['Model']:
+        """Find several records by primary key with a single IN query
+        
+        Rows already in the request cache are served from it; the rest are
+        loaded together and cached. Missing keys are skipped and the result
+        follows the order of ``ids``.
+        """
+        cache = _row_cache()
+        table = cls.table
+        rows = {}
+        missing = []
+        for id in dict.fromkeys(ids):
+            key = (table, str(id))
+            if cache is not None and key in cache:
+                rows[key[1]] = cache[key]
+            else:
+                missing.append(id)
+        
+        if missing:
+            for result in cls.query().where_in(cls.primary_key, missing).get():
+                pk = str(result[cls.primary_key])
+                rows[pk] = result
+                if cache is not None:
+                    cache[(table, pk)] = result
+        
+        return [cls._hydrate(rows[str(id)]) for id in ids if str(id) in rows]
+    
     @classmethod
     def where(cls, column: str, operator: str = '=', value: Any = None):
         """Add a where clause and return query builder"""
@@ -325,6 +429,37 @@ class Model(metaclass=ModelMeta):
         instance.save()
         return instance
     
+    @classmethod
+    def bulk_create(cls, rows: List[Dict[str, Any]]) -> int:
+        """Create many records in one batched INSERT inside a single transaction
+        
+        Every row must have the same keys; the columns are taken from the first.
+        
+        Raises:
+            ValueError: If a row's keys differ from the first row's
+        """
+        if not rows:
+            return 0
+        
+        keys = rows[0].keys()
+        for index, row in enumerate(rows):
+            if row.keys() != keys:
+                raise ValueError(
+                    f"bulk_create rows must all have the same keys; row {index} "
+                    f"has {sorted(row)}, expected {sorted(keys)}"
+                )
+        
+        is_fillable = cls._is_fillable
+        columns = [k for k in keys if is_fillable(k)]
+        values = [tuple(row[column] for column in columns) for row in rows]
+        
+        if cls.timestamps:
+            now = datetime.now().isoformat()
+            columns += [cls.created_at, cls.updated_at]
+            values = [row + (now, now) for row in values]
+        
+        return cls.query().insert_many(columns, values)
+    
     @classmethod
     def _hydrate(cls, data: Dict) -> 'Model':
         """Create a model instance from database data"""
@@ -411,12 +546,28 @@ class Model(metaclass=ModelMeta):
         """Get the primary key value"""
         return self.attributes.get(self.primary_key)
     
+    @classmethod
+    def _mass_assignment_columns(cls) -> tuple:
+        """Get the (fillable, guarded) columns as frozensets, cached per class"""
+        cached = cls.__dict__.get('_mass_assignment_cache')
+        if cached is None:
+            cached = (frozenset(cls.fillable), frozenset(cls.guarded))
+            cls._mass_assignment_cache = cached
+        return cached
+    
+    @classmethod
+    def _is_fillable(cls, key: str) -> bool:
+        """Determine if the given attribute may be mass assigned"""
+        fillable, guarded = cls._mass_assignment_columns()
+        return key in fillable if fillable else key not in guarded
+    
     def _get_fillable_attributes(self) -> Dict[str, Any]:
         """Get fillable attributes"""
-        if self.fillable:
-            return {k: v for k, v in self.attributes.items() if k in self.fillable}
+        fillable, guarded = self._mass_assignment_columns()
+        if fillable:
+            return {k: v for k, v in self.attributes.items() if k in fillable}
         else:
-            return {k: v for k, v in self.attributes.items() if k not in self.guarded}
+            return {k: v for k, v in self.attributes.items() if k not in guarded}
     
     def _get_dirty(self) -> Dict[str, Any]:
         """Get dirty (changed) attributes"""
@@ -1,5 +1,5 @@
 from flask import request as flask_request
-from typing import Any, Dict
+from typing import Any, Dict, Iterable
 
 class Request:
     """Laravel-style Request wrapper"""
@@ -43,10 +43,10 @@ class Request:
         """Get all input data"""
         return self.input()
     
-    def only(self, keys: list) -> Dict[str, Any]:
-        """Get only specified keys from input"""
+    def only(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get only specified keys from input (any iterable, e.g. a frozenset constant)"""
         all_input = self.all()
-        return {key: all_input.get(key) for key in keys if key in all_input}
+        return {key: all_input[key] for key in keys if key in all_input}
     
     def except_keys(self, keys: list) -> Dict[str, Any]:
         """Get all input except specified keys"""
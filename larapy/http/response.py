@@ -1,12 +1,42 @@
 """Laravel-style Response classes for HTTP responses."""
 
 import json
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, Optional, Union
 from flask import make_response, Response as FlaskResponse
 
 from ..contracts import Macroable, Jsonable, Arrayable, Renderable
 from .concerns import ResponseTrait
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+if orjson is not None:
+    # Leave datetimes and dataclasses to default=str, as the standard library does
+    _ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+                       | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+
+def _dumps(data: Any) -> str:
+    """
+    Encode data as JSON, using orjson when it is installed.
+    
+    Both paths give the same values: unknown types, datetimes included, go
+    through str(), so a datetime reads '2024-01-02 03:04:05'. orjson output
+    differs only in being compact, in writing NaN and Infinity as null and
+    in writing Enum members as their value.
+    Anything orjson rejects, such as integers wider than 64 bits, is encoded
+    by the standard library instead.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+        except TypeError:
+            pass
+    return json.dumps(data, ensure_ascii=False, default=str)
+
 
 class Response(ResponseTrait, Macroable):
     """Laravel-style Response class."""
@@ -58,15 +88,30 @@ class Response(ResponseTrait, Macroable):
             json_content = data.to_json()
         # Handle Arrayable objects
         elif hasattr(data, 'to_array'):
-            json_content = json.dumps(data.to_array(), ensure_ascii=False)
+            json_content = _dumps(data.to_array())
         # Handle regular objects
         else:
-            json_content = json.dumps(data, ensure_ascii=False, default=str)
+            json_content = _dumps(data)
         
         response = Response(json_content, status, headers)
         response.header('Content-Type', 'application/json')
         return response
     
+    @staticmethod
+    def stream_json(items: Iterable, status: int = 200, headers: Optional[Dict] = None) -> FlaskResponse:
+        """Create a JSON array response that encodes items one at a time as it streams."""
+        def generate():
+            yield '['
+            first = True
+            for item in items:
+                if not first:
+                    yield ','
+                first = False
+                yield _dumps(item)
+            yield ']'
+        
+        return FlaskResponse(generate(), status=status, headers=headers, mimetype='application/json')
+    
     @staticmethod
     def view(view_name: str, data: Optional[Dict] = None, status: int = 200, headers: Optional[Dict] = None):
         """Create a view response."""
@@ -55,8 +55,8 @@ class ThrottleRequests:
             # Generate rate limit key
             key = self._resolve_request_signature(max_attempts, decay_minutes)
             
-            # Check rate limit
-            if self.rate_limiter.too_many_attempts(key, max_attempts, decay_minutes):
+            # Record the hit and check the rate limit
+            if not self.rate_limiter.attempt(key, max_attempts, decay_minutes):
                 self._build_too_many_attempts_response(key, max_attempts, decay_minutes)
             
             # Add rate limit headers to response
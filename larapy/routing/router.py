@@ -1,6 +1,10 @@
 from flask import request, jsonify
 from typing import Callable, Dict, List, Any
 import inspect
+import re
+
+# Matches Laravel-style {param} segments in route URIs
+_PARAMETER_PATTERN = re.compile(r'{(\w+)}')
 
 class Router:
     """Laravel-style Router implementation"""
@@ -46,6 +50,14 @@ class Router:
         if isinstance(middleware, str):
             middleware = [middleware]
         
+        # Work out how to dispatch the action once, at registration
+        if callable(action):
+            dispatch = lambda parameters: self._call_action(action, parameters)
+        elif isinstance(action, str):
+            dispatch = self._controller_dispatcher(action)
+        else:
+            dispatch = lambda parameters: action
+        
         # Create the route handler
         def route_handler(*args, **kwargs):
             # Run middleware
@@ -55,12 +67,7 @@ class Router:
                     # Apply middleware (simplified implementation)
             
             # Handle the action
-            if callable(action):
-                return self._call_action(action, kwargs)
-            elif isinstance(action, str):
-                return self._call_controller_action(action, kwargs)
-            else:
-                return action
+            return dispatch(kwargs)
         
         # Register with Flask
         endpoint = options.get('as', f"{methods[0].lower()}_{uri.replace('/', '_').replace('{', '').replace('}', '')}")
@@ -76,8 +83,7 @@ class Router:
     def _convert_uri(self, uri: str) -> str:
         """Convert Laravel URI format to Flask format"""
         # Convert {param} to <param>
-        import re
-        return re.sub(r'{(\w+)}', r'<\1>', uri)
+        return _PARAMETER_PATTERN.sub(r'<\1>', uri)
     
     def _call_action(self, action: Callable, parameters: Dict):
         """Call a closure action with dependency injection"""
@@ -110,20 +116,25 @@ class Router:
         except Exception as e:
             return str(e), 500
     
-    def _call_controller_action(self, action: str, parameters: Dict):
-        """Call a controller action"""
-        # Parse Controller@method format
-        if '@' in action:
-            controller_name, method = action.split('@')
-            
-            # Resolve controller from container
-            controller = self.app.resolve(controller_name)
-            
-            # Call method with dependency injection
-            method_func = getattr(controller, method)
-            return self._call_action(method_func, parameters)
+    def _controller_dispatcher(self, action: str) -> Callable:
+        """Build a dispatcher for a Controller@method action
+        
+        The action string is parsed here, once. The controller itself is
+        still resolved from the container on every request, so its binding
+        (transient or singleton) decides whether an instance is reused.
+        """
+        if '@' not in action:
+            return lambda parameters: ("Invalid controller action format", 500)
+        
+        controller_name, method = action.split('@')
+        resolve = self.app.resolve
+        call_action = self._call_action
+        
+        def dispatch(parameters: Dict):
+            controller = resolve(controller_name)
+            return call_action(getattr(controller, method), parameters)
         
-        return "Invalid controller action format", 500
+        return dispatch
     
     def middleware(self, name: str, middleware_class: str):
         """Register a middleware"""
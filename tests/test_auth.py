@@ -11,7 +11,7 @@ from werkzeug.security import generate_password_hash
 
 from larapy.auth.auth_manager import AuthManager
 from larapy.auth.authenticatable import Authenticatable
-from larapy.auth.middleware import auth_required, guest_only, auth_api, guest_api
+from larapy.auth.middleware import auth_required, guest_only, auth_api, guest_api, AuthMiddleware
 from larapy.support.facades.auth import Auth
 from larapy.foundation.application import Application
 
@@ -139,7 +139,20 @@ class TestAuthManager:
             current_user = self.auth_manager.user()
             assert current_user is not None
             assert current_user.id == user.id
-            
+
+    def test_user_cached_per_request(self):
+        """Test the authenticated user is loaded once per request"""
+        with self.app.test_request_context():
+            session['user_id'] = 1
+            session['user_authenticated'] = True
+
+            with patch.object(MockUser, 'find', wraps=MockUser.find) as find:
+                first = self.auth_manager.user()
+                second = self.auth_manager.user()
+
+            assert first is second
+            assert find.call_count == 1
+
     def test_user_not_authenticated(self):
         """Test getting user when not authenticated"""
         with self.app.test_request_context():
@@ -234,6 +247,24 @@ class TestAuthenticatable:
         user = MockUser()
         assert user.verify_password('wrong-password') is False
         
+    def test_verify_password_cache_holds_no_plain_text(self):
+        """Test memoized verification keys on a digest, not the password"""
+        from larapy.auth import authenticatable
+        
+        user = MockUser(password='cache-secret')
+        assert user.verify_password('cache-secret') is True
+        
+        keys = [key for key in authenticatable._VERIFY_CACHE if key[0] == user.password]
+        assert keys
+        assert all(key[1] != 'cache-secret' and isinstance(key[1], bytes) for key in keys)
+        
+        # Logging someone out does not flush everyone's cached checks
+        app = Flask(__name__)
+        app.secret_key = 'test-secret-key'
+        with app.test_request_context():
+            AuthManager(app).logout()
+        assert keys[0] in authenticatable._VERIFY_CACHE
+        
     def test_set_remember_token(self):
         """Test setting remember token"""
         user = MockUser()
@@ -310,6 +341,40 @@ class TestMiddleware:
             # Should return JSON error
             assert result[1] == 401
             
+    def test_auth_required_on_method(self):
+        """Test auth_required on a controller method"""
+        class Controller:
+            @auth_required()
+            def index(self):
+                """List things"""
+                return 'protected content'
+        
+        assert Controller.index.__doc__ == 'List things'
+        assert Controller.index.__module__ == __name__
+        
+        with self.app.test_request_context():
+            session['user_authenticated'] = True
+            session['user_id'] = 1
+            
+            assert Controller().index() == 'protected content'
+            
+    def test_auth_middleware_is_per_app(self):
+        """Test each app's decorators use that app's AuthManager"""
+        other_app = Flask(__name__)
+        signed_in = Mock(check=Mock(return_value=True))
+        signed_out = Mock(check=Mock(return_value=False))
+        AuthMiddleware(self.app, auth=signed_in)
+        AuthMiddleware(other_app, auth=signed_out)
+        
+        @auth_required()
+        def protected_route():
+            return 'protected content'
+            
+        with self.app.test_request_context():
+            assert protected_route() == 'protected content'
+        with other_app.test_request_context():
+            assert protected_route().status_code == 302
+            
     def test_guest_only_authenticated(self):
         """Test guest_only with authenticated user"""
         @guest_only()
@@ -336,6 +401,32 @@ class TestMiddleware:
             assert result == 'guest content'
 
 
+class TestAuthenticate:
+    """Test the guard-based Authenticate middleware"""
+    
+    def test_user_model_resolved_lazily(self, monkeypatch):
+        """Test the User model is imported on first use, not at import time"""
+        import sys
+        import types
+        from larapy.auth.middleware import authenticate
+        
+        monkeypatch.setattr(authenticate, '_USER_MODEL', None)
+        monkeypatch.setitem(sys.modules, 'app', None)
+        
+        # No fabricated user while the model cannot be imported
+        assert authenticate.auth_middleware._load_user(1) is None
+        assert authenticate._USER_MODEL is None
+        
+        models = types.ModuleType('app.Models.User')
+        models.User = MockUser
+        monkeypatch.setitem(sys.modules, 'app', types.ModuleType('app'))
+        monkeypatch.setitem(sys.modules, 'app.Models', types.ModuleType('app.Models'))
+        monkeypatch.setitem(sys.modules, 'app.Models.User', models)
+        
+        assert authenticate.auth_middleware._load_user(1).id == 1
+        assert authenticate._USER_MODEL is MockUser
+
+
 class TestAuthFacade:
     """Test the Auth facade"""
     
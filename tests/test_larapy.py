@@ -1,6 +1,8 @@
 import pytest
 import tempfile
 import os
+import sys
+import json
 from larapy import Application, Container
 
 
@@ -154,6 +156,103 @@ class TestConfig:
         assert repo.get('app.debug') is True
         assert repo.get('app.name') == 'Test App'
 
+    def test_repository_has(self):
+        from larapy.config.repository import Repository
+
+        repo = Repository('/nonexistent/path')
+        repo.set('app.debug', False)
+        repo.set('app.timezone', None)
+
+        assert repo.has('app')
+        assert repo.has('app.debug')
+        assert repo.has('app.timezone')
+        assert not repo.has('app.name')
+        assert not repo.has('database.default')
+
+    def test_repository_loads_files_in_order(self, caplog):
+        from larapy.config.repository import Repository
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name, body in (('cache', 'DRIVER = "file"'), ('app', 'NAME = "Larapy"'), ('broken', 'NAME = ')):
+                with open(os.path.join(tmpdir, f'{name}.py'), 'w') as f:
+                    f.write(body)
+
+            with caplog.at_level('ERROR', logger='larapy.config'):
+                repo = Repository(tmpdir)
+
+        assert list(repo.all()) == ['app', 'cache']
+        assert repo.get('app.name') == 'Larapy'
+        assert 'broken' in caplog.text
+
+    def test_repository_reads_nested_mutation(self):
+        from larapy.config.repository import Repository
+
+        repo = Repository('/nonexistent/path')
+        repo.set('database.connections.sqlite.database', 'a.db')
+
+        repo.get('database.connections')['sqlite']['database'] = 'b.db'
+        assert repo.get('database.connections.sqlite.database') == 'b.db'
+
+
+class TestSecurityConfig:
+    """Test the cached security configuration"""
+
+    @pytest.fixture(autouse=True)
+    def fresh_config(self):
+        from larapy.config.security import reset_security_config
+
+        reset_security_config()
+        yield
+        reset_security_config()
+
+    def test_config_is_read_only(self):
+        from larapy.config.security import get_security_config
+
+        config = get_security_config()
+        assert get_security_config() is config
+        assert isinstance(config['cors']['allowed_origins'], tuple)
+        with pytest.raises(TypeError):
+            config['cors']['max_age'] = 10
+        with pytest.raises(TypeError):
+            config['auth']['guards']['web']['driver'] = 'token'
+
+    def test_config_dict_is_plain(self):
+        from larapy.config.security import get_security_config, get_security_config_dict
+
+        config = get_security_config_dict()
+        assert isinstance(config['csrf']['exclude'], list)
+        json.dumps(config)
+
+        config['csrf']['exclude'].append('admin/*')
+        assert 'admin/*' not in get_security_config()['csrf']['exclude']
+
+    def test_reset_rereads_environment(self, monkeypatch):
+        from larapy.config.security import get_security_config, reset_security_config
+
+        monkeypatch.setenv('CORS_MAX_AGE', '30')
+        monkeypatch.setenv('CORS_ALLOWED_ORIGINS', 'https://a.test, https://b.test')
+        monkeypatch.setenv('ENCRYPT_COOKIES', 'false')
+        reset_security_config()
+
+        config = get_security_config()
+        assert config['cors']['max_age'] == 30
+        assert config['cors']['allowed_origins'] == ('https://a.test', 'https://b.test')
+        assert config['cookies']['encrypt'] is False
+
+        monkeypatch.setenv('CORS_MAX_AGE', '60')
+        assert get_security_config()['cors']['max_age'] == 30
+        reset_security_config()
+        assert get_security_config()['cors']['max_age'] == 60
+
+    def test_csp_presets(self):
+        from larapy.config.security import get_csp_policy, get_security_config
+
+        presets = get_security_config()['csp_presets']
+        assert set(presets) == {'strict', 'moderate', 'permissive'}
+        assert get_csp_policy('strict') == presets['strict']
+        assert get_csp_policy('unknown') == presets['moderate']
+        assert get_csp_policy() == presets['moderate']
+
 
 class TestORM:
     """Test the ORM functionality"""
@@ -239,6 +338,245 @@ class TestORM:
         assert result is not None
         assert result['name'] == 'Test User'
 
+    @pytest.fixture
+    def user_model(self):
+        """A Model bound to a fresh in-memory users table"""
+        from larapy.database.orm import Model, Schema, DatabaseConnection
+
+        connection = DatabaseConnection({'driver': 'sqlite', 'database': ':memory:'})
+        Schema(connection).create_table(
+            'orm_users', lambda table: table.id().string('name').string('email').timestamps()
+        )
+
+        class OrmUser(Model):
+            table = 'orm_users'
+            fillable = ['name', 'email']
+
+        OrmUser.set_connection(connection)
+        return OrmUser
+
+    def test_bulk_create(self, user_model):
+        inserted = user_model.bulk_create([
+            {'name': 'John Doe', 'email': 'john@example.com'},
+            {'name': 'Jane Smith', 'email': 'jane@example.com'},
+        ])
+
+        assert inserted == 2
+        users = user_model.all()
+        assert [user.name for user in users] == ['John Doe', 'Jane Smith']
+        assert users[0].created_at is not None
+
+    def test_bulk_create_rejects_mismatched_rows(self, user_model):
+        with pytest.raises(ValueError):
+            user_model.bulk_create([
+                {'name': 'John Doe'},
+                {'name': 'Jane Smith', 'email': 'jane@example.com'},
+            ])
+        assert user_model.query().count() == 0
+
+    def test_exists(self, user_model):
+        assert user_model.query().exists() is False
+        user = user_model.create(name='John Doe')
+        assert user_model.query().exists() is True
+        assert user.exists is True
+        assert user_model.find(1).exists is True
+
+    def test_cursor(self, user_model):
+        user_model.bulk_create([{'name': 'John Doe'}, {'name': 'Jane Smith'}])
+
+        rows = user_model.query().select('id', 'name').cursor()
+        assert not isinstance(rows, list)
+        assert list(rows) == [{'id': 1, 'name': 'John Doe'}, {'id': 2, 'name': 'Jane Smith'}]
+
+    def test_find_is_cached_per_request(self, user_model):
+        from flask import Flask
+        from unittest.mock import patch
+
+        user_model.create(name='John Doe')
+        connection = user_model._connection()
+
+        with Flask(__name__).test_request_context():
+            with patch.object(connection, 'fetch_one', wraps=connection.fetch_one) as fetch_one:
+                user = user_model.find(1)
+                again = user_model.find(1)
+            assert fetch_one.call_count == 1
+            assert again is not user
+
+            # Unsaved changes stay on their own instance
+            user.name = 'Jane Smith'
+            assert user_model.find(1).name == 'John Doe'
+
+            user.save()
+            assert user_model.find(1).name == 'Jane Smith'
+
+    def test_find_cache_dropped_by_query_writes(self, user_model):
+        from flask import Flask
+
+        user_model.create(name='John Doe')
+
+        with Flask(__name__).test_request_context():
+            assert user_model.find(1).name == 'John Doe'
+            user_model.where('id', 1).update({'name': 'Jane Smith'})
+            assert user_model.find(1).name == 'Jane Smith'
+
+            user_model.where('id', 1).delete()
+            assert user_model.find(1) is None
+
+    def test_find_not_cached_outside_request(self, user_model):
+        from flask import Flask
+        from unittest.mock import patch
+
+        user_model.create(name='John Doe')
+        connection = user_model._connection()
+
+        with Flask(__name__).app_context():
+            with patch.object(connection, 'fetch_one', wraps=connection.fetch_one) as fetch_one:
+                user_model.find(1)
+                user_model.find(1)
+            assert fetch_one.call_count == 2
+
+    def test_find_many(self, user_model):
+        from flask import Flask
+        from unittest.mock import patch
+
+        user_model.bulk_create([{'name': 'John Doe'}, {'name': 'Jane Smith'}])
+
+        users = user_model.find_many([2, 3, 1])
+        assert [user.name for user in users] == ['Jane Smith', 'John Doe']
+
+        connection = user_model._connection()
+        with Flask(__name__).test_request_context():
+            user_model.find(1)
+            with patch.object(connection, 'fetch_all', wraps=connection.fetch_all) as fetch_all:
+                users = user_model.find_many([1, 2])
+                assert [user.name for user in users] == ['John Doe', 'Jane Smith']
+                assert user_model.find(2).name == 'Jane Smith'
+            # Only the uncached key is queried, and find(2) is then served from the cache
+            assert fetch_all.call_count == 1
+            assert fetch_all.call_args[0][1] == (2,)
+
+
+class FakeRedisPipeline:
+    """Queue INCR and EXPIRE NX calls and run them against a FakeRedis"""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(('incr', key))
+
+    def expire(self, key, seconds, nx=False):
+        assert nx
+        self.commands.append(('expire', key, seconds))
+
+    def execute(self):
+        results = []
+        for command in self.commands:
+            if command[0] == 'incr':
+                self.redis.values[command[1]] = self.redis.values.get(command[1], 0) + 1
+                results.append(self.redis.values[command[1]])
+            else:
+                results.append(self.redis.ttls.setdefault(command[1], command[2]) == command[2])
+        return results
+
+
+class FakeRedis:
+    """Just enough of a redis client for RateLimiter"""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+
+    def pipeline(self):
+        return FakeRedisPipeline(self)
+
+    def get(self, key):
+        value = self.values.get(key)
+        return None if value is None else str(value).encode()
+
+    def ttl(self, key):
+        return self.ttls.get(key, -2)
+
+    def delete(self, key):
+        self.values.pop(key, None)
+        self.ttls.pop(key, None)
+
+
+class TestRateLimiter:
+    """Test the RateLimiter dict and Redis stores"""
+
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        from larapy.cache import rate_limiter
+
+        now = [1000.0]
+        monkeypatch.setattr(rate_limiter, '_now', lambda: now[0])
+        return now
+
+    def test_attempt_and_hits(self, clock):
+        from larapy.cache.rate_limiter import RateLimiter
+
+        limiter = RateLimiter()
+        assert [limiter.attempt('login', 2) for _ in range(3)] == [True, True, False]
+        assert limiter.hits('login') == 2
+        assert limiter.too_many_attempts('login', 2)
+        assert limiter.hits('login') == 2
+        assert limiter.available_in('login') == 60
+
+    def test_window_expiry(self, clock):
+        from larapy.cache.rate_limiter import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.attempt('login', 1)
+        assert not limiter.attempt('login', 1)
+
+        clock[0] += 60
+        assert limiter.hits('login') == 0
+        assert limiter.available_in('login') == 0
+        assert limiter.attempt('login', 1)
+
+    def test_clear(self, clock):
+        from larapy.cache.rate_limiter import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.attempt('login', 1)
+        limiter.clear('login')
+        assert limiter.hits('login') == 0
+        assert limiter.attempt('login', 1)
+
+    def test_sweep_drops_expired_windows(self, clock):
+        from larapy.cache.rate_limiter import RateLimiter
+
+        limiter = RateLimiter()
+        limiter.attempt('old', 1)
+        clock[0] += 60
+        limiter.attempt('new', 1)
+        limiter._sweep(clock[0])
+        assert list(limiter.cache) == ['new']
+
+    def test_too_many_attempts_does_not_consume(self, clock):
+        from larapy.cache.rate_limiter import RateLimiter
+
+        limiter = RateLimiter()
+        assert not limiter.too_many_attempts('login', 1)
+        assert limiter.hits('login') == 0
+        assert limiter.attempt('login', 1)
+
+    def test_redis_store(self):
+        from larapy.cache.rate_limiter import RateLimiter
+
+        redis = FakeRedis()
+        limiter = RateLimiter(redis=redis)
+        assert [limiter.attempt('api', 2, decay_minutes=2) for _ in range(3)] == [True, True, False]
+        assert limiter.hits('api') == 3
+        assert limiter.too_many_attempts('api', 2)
+        assert limiter.available_in('api') == 120
+
+        limiter.clear('api')
+        assert limiter.hits('api') == 0
+        assert limiter.available_in('api') == 0
+
 
 class TestRouting:
     """Test the Routing system"""
@@ -268,6 +606,28 @@ class TestRouting:
         assert router._convert_uri('/users/{id}') == '/users/<id>'
         assert router._convert_uri('/posts/{id}/comments/{comment_id}') == '/posts/<id>/comments/<comment_id>'
 
+    def test_controller_resolved_per_request(self):
+        from larapy.routing.router import Router
+        from larapy import Application
+
+        app = Application()
+        router = Router(app)
+
+        class CounterController:
+            def __init__(self):
+                self.calls = 0
+
+            def index(self):
+                self.calls += 1
+                return str(self.calls)
+
+        app.bind('CounterController', lambda c: CounterController())
+        router.get('/counter', 'CounterController@index')
+
+        client = app.flask_app.test_client()
+        assert client.get('/counter').data == b'1'
+        assert client.get('/counter').data == b'1'
+
 
 class TestHTTP:
     """Test HTTP Request and Response handling"""
@@ -287,6 +647,90 @@ class TestHTTP:
         text_response = Response.make('Hello World', 200)
         assert text_response.status_code == 200
 
+    @pytest.mark.parametrize('use_orjson', [True, False])
+    def test_json_encoding(self, use_orjson, monkeypatch):
+        from datetime import datetime
+        from larapy.http import response
+
+        if use_orjson:
+            pytest.importorskip('orjson')
+        else:
+            monkeypatch.setattr(response, 'orjson', None)
+
+        encoded = response._dumps({'at': datetime(2024, 1, 2, 3, 4, 5), 'big': 2 ** 70, 'name': 'é'})
+        assert json.loads(encoded) == {'at': '2024-01-02 03:04:05', 'big': 2 ** 70, 'name': 'é'}
+
+    def test_stream_json(self):
+        from larapy.http.response import Response
+
+        def rows():
+            yield {'id': 1, 'name': 'John Doe'}
+            yield {'id': 2, 'name': 'Jane Smith'}
+
+        response = Response.stream_json(rows())
+        assert response.status_code == 200
+        assert response.mimetype == 'application/json'
+        assert response.is_streamed
+        assert json.loads(response.get_data(as_text=True)) == [
+            {'id': 1, 'name': 'John Doe'},
+            {'id': 2, 'name': 'Jane Smith'},
+        ]
+        assert Response.stream_json(iter(())).get_data(as_text=True) == '[]'
+
+
+class TestConsoleKernel:
+    """Test console command registration and lookup"""
+
+    @pytest.fixture
+    def kernel(self, tmp_path, monkeypatch):
+        from larapy.console.kernel import ConsoleKernel
+
+        monkeypatch.chdir(tmp_path)
+        return ConsoleKernel()
+
+    def test_command_module_imported_when_run(self, kernel, tmp_path, monkeypatch):
+        from larapy.console import kernel as kernel_module
+
+        (tmp_path / 'lazy_demo_command.py').write_text(
+            "class DemoCommand:\n"
+            "    description = 'Run the demo'\n"
+            "    def run(self, args):\n"
+            "        return 7\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.delitem(sys.modules, 'lazy_demo_command', raising=False)
+        monkeypatch.setattr(kernel_module, '_CLASS_CACHE', {})
+
+        kernel.register_command('demo:run', 'lazy_demo_command:DemoCommand')
+        kernel.show_help()
+        assert kernel.find_prefix_matches('demo') == ['demo:run']
+        assert 'lazy_demo_command' not in sys.modules
+
+        assert kernel.handle(['demo:run']) == 7
+        assert 'lazy_demo_command' in sys.modules
+        assert 'lazy_demo_command:DemoCommand' in kernel_module._CLASS_CACHE
+
+    def test_description_read_from_class(self, kernel):
+        class StrictCommand:
+            description = 'Declared on the class'
+            signature = 'strict:run {name}'
+
+            def __init__(self):
+                raise AssertionError('command should not be instantiated')
+
+        kernel.register_command('strict:run', StrictCommand)
+        assert kernel.get_command_description('strict:run') == 'Declared on the class'
+        assert kernel.get_command_meta('strict:run').signature == 'strict:run {name}'
+        assert kernel.get_command_description('make:model') == 'Create a new Eloquent model class'
+
+    def test_similar_commands_suggested(self, kernel, capsys):
+        assert 'migrate' in kernel.find_similar_commands('migrat')
+
+        assert kernel.handle(['migrat']) == 1
+        out = capsys.readouterr().out
+        assert 'Did you mean one of these?' in out
+        assert '  migrate\n' in out
+
 
 if __name__ == '__main__':
     pytest.main([__file__])